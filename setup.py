@@ -17,6 +17,10 @@ setup(
         "pyodps>=0.11.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.9.0",
+            "hyperscan>=0.4.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -1,14 +1,93 @@
 """Configuration loader for DW MCP server."""
 
 import os
+import re
+import mmap
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple
+
+# KEY=VALUE lines; comment lines and lines without '=' never match.
+# Key and value are stripped after matching.
+_KV_RE = re.compile(rb'^[ \t]*([^#=\s][^=\n]*)=([^\n]*)$', re.MULTILINE)
+
+# Parsed .env contents keyed by path, tagged with the (mtime, size) they were read at
+_ENV_CACHE: Dict[str, Tuple[float, int, Dict[str, str]]] = {}
+
+# Discovered .env path per working directory (None when no .env was found)
+_DISCOVERED_ENV_PATHS: Dict[str, Optional[str]] = {}
+
+
+def reset_env_cache() -> None:
+    """Forget discovered .env locations and cached .env contents."""
+    _DISCOVERED_ENV_PATHS.clear()
+    _ENV_CACHE.clear()
+
+
+def _discover_env_file() -> Optional[str]:
+    """
+    Find a .env file in the current directory or up to 2 parent directories.
+    
+    The result (including "not found") is cached per working directory.
+    
+    Returns:
+        Path to the .env file, or None if not found
+    """
+    cwd = Path.cwd()
+    cwd_key = str(cwd)
+    if cwd_key in _DISCOVERED_ENV_PATHS:
+        return _DISCOVERED_ENV_PATHS[cwd_key]
+    
+    found = None
+    current_dir = cwd
+    for _ in range(3):  # Check up to 3 levels up
+        env_path = current_dir / '.env'
+        if env_path.exists():
+            found = str(env_path)
+            break
+        current_dir = current_dir.parent
+    
+    _DISCOVERED_ENV_PATHS[cwd_key] = found
+    return found
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, str]:
+    """
+    Parse a .env file into a dictionary of KEY -> VALUE.
+    
+    Args:
+        env_path: Path to .env file
+        
+    Returns:
+        Parsed variables, in file order
+    """
+    parsed = {}
+    
+    with open(env_path, 'rb') as f:
+        # mmap can't map an empty file; there is nothing to parse anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return parsed
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _KV_RE.finditer(mm):
+                key = match.group(1).strip().decode('utf-8')
+                value = match.group(2).strip().decode('utf-8')
+                
+                # Remove quotes if present
+                if len(value) >= 2 and value[0] in ('"', "'") and value[-1] == value[0]:
+                    value = value[1:-1]
+                
+                parsed[key] = value
+    
+    return parsed
 
 
 def load_env_file(env_file: Optional[str] = None) -> bool:
     """
     Load environment variables from a .env file.
     
+    Parsed contents are cached per path and reused while the file's mtime and
+    size are unchanged.
+    
     Args:
         env_file: Path to .env file. If None, looks for .env in current directory
         
@@ -17,47 +96,31 @@ def load_env_file(env_file: Optional[str] = None) -> bool:
     """
     if env_file is None:
         # Look for .env in current directory and parent directories
-        current_dir = Path.cwd()
-        for _ in range(3):  # Check up to 3 levels up
-            env_path = current_dir / '.env'
-            if env_path.exists():
-                env_file = str(env_path)
-                break
-            current_dir = current_dir.parent
+        env_file = _discover_env_file()
     
     if env_file is None:
         return False
     
     env_path = Path(env_file)
-    if not env_path.exists():
+    try:
+        st = env_path.stat()
+    except OSError:
         return False
     
-    # Parse .env file
+    # Parse .env file (or reuse the cached parse if the file is unchanged)
     try:
-        with open(env_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse KEY=VALUE format
-                if '=' in line:
-                    # Split only on first =
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Only set if not already in environment (env vars take precedence)
-                    if key not in os.environ:
-                        os.environ[key] = value
+        cache_key = str(env_path)
+        cached = _ENV_CACHE.get(cache_key)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            parsed = cached[2]
+        else:
+            parsed = _parse_env_file(env_path)
+            _ENV_CACHE[cache_key] = (st.st_mtime, st.st_size, parsed)
+        
+        for key, value in parsed.items():
+            # Only set if not already in environment (env vars take precedence)
+            if key not in os.environ:
+                os.environ[key] = value
         
         return True
     except Exception as e:
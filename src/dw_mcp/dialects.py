@@ -1,7 +1,207 @@
 """SQL dialect helpers for different data warehouse platforms."""
 
+import io
+from types import MappingProxyType
 from typing import Dict, Any
 from .connections import Platform
+from .serialization import dumps
+
+# Static platform metadata, built once at import. The returned dicts are shared
+# between callers and must not be mutated.
+_PLATFORM_INFO = MappingProxyType(
+    {
+        Platform.MAXCOMPUTE: {
+            "name": "MaxCompute",
+            "type": "Offline Data Warehouse",
+            "description": "Alibaba Cloud MaxCompute for offline DW tables and batch processing",
+            "dialect": "MaxCompute SQL (similar to Hive)",
+            "use_cases": ["Offline analytics", "Batch processing", "Data warehouse"],
+            "features": [
+                "Partitioned tables",
+                "Distributed processing",
+                "UDF support",
+                "Cost-based optimization",
+            ],
+            "common_functions": [
+                "WCOUNT() - Word count",
+                "GET_JSON_OBJECT() - Parse JSON",
+                "CONCAT_WS() - Concatenate with separator",
+                "TO_DATE() - Date conversion",
+            ],
+        },
+        Platform.HOLOGRES: {
+            "name": "Hologres",
+            "type": "Real-time Analytics",
+            "description": "Alibaba Cloud Hologres for real-time analytics and OLAP",
+            "dialect": "PostgreSQL-compatible",
+            "use_cases": ["Real-time analytics", "OLAP", "Interactive queries"],
+            "features": [
+                "PostgreSQL compatible",
+                "Real-time data serving",
+                "High-performance queries",
+                "Row and column storage",
+            ],
+            "common_functions": [
+                "Standard PostgreSQL functions",
+                "Window functions",
+                "JSON functions",
+                "Array functions",
+            ],
+        },
+        Platform.MYSQL: {
+            "name": "MySQL",
+            "type": "Source System",
+            "description": "MySQL database for source systems and transactional data",
+            "dialect": "MySQL",
+            "use_cases": ["OLTP", "Application databases", "Source data"],
+            "features": [
+                "ACID transactions",
+                "Stored procedures",
+                "Triggers",
+                "Full-text search",
+            ],
+            "common_functions": [
+                "NOW() - Current timestamp",
+                "CONCAT() - String concatenation",
+                "DATE_FORMAT() - Format dates",
+                "IFNULL() - Null handling",
+            ],
+        },
+        Platform.POLARDB: {
+            "name": "PolarDB",
+            "type": "Source System",
+            "description": "Alibaba Cloud PolarDB for MySQL-compatible source systems",
+            "dialect": "MySQL-compatible",
+            "use_cases": ["OLTP", "High-performance databases", "Source data"],
+            "features": [
+                "MySQL compatible",
+                "High performance",
+                "Distributed storage",
+                "Read replicas",
+            ],
+            "common_functions": [
+                "MySQL-compatible functions",
+                "JSON functions",
+                "Full-text search",
+                "GIS functions",
+            ],
+        },
+        Platform.REDSHIFT: {
+            "name": "Redshift",
+            "type": "Regional Data Warehouse",
+            "description": "AWS Redshift for EU data and regional analytics",
+            "dialect": "PostgreSQL-based",
+            "use_cases": ["Data warehouse", "Regional analytics", "EU data"],
+            "features": [
+                "Columnar storage",
+                "Massively parallel processing",
+                "Distribution keys",
+                "Sort keys",
+            ],
+            "common_functions": [
+                "LISTAGG() - String aggregation",
+                "MEDIAN() - Median calculation",
+                "PERCENTILE_CONT() - Percentiles",
+                "JSON_EXTRACT_PATH_TEXT() - JSON parsing",
+            ],
+        },
+    }
+)
+
+# The platform/name/type/description subset listed by the list_platforms tool.
+# Plain dicts (not MappingProxyType) so they serialize directly; do not mutate.
+_PLATFORM_SUMMARY = MappingProxyType(
+    {
+        p: {
+            "platform": p.value,
+            "name": info["name"],
+            "type": info["type"],
+            "description": info["description"],
+        }
+        for p, info in _PLATFORM_INFO.items()
+    }
+)
+
+# Info for unrecognized platforms; "name" is filled in per call
+_UNKNOWN_PLATFORM_INFO = {
+    "type": "Unknown",
+    "description": "Unknown platform",
+    "dialect": "SQL",
+    "use_cases": [],
+    "features": [],
+    "common_functions": [],
+}
+
+_EXAMPLE_QUERIES = MappingProxyType(
+    {
+        Platform.MAXCOMPUTE: [
+            {"description": "List all tables in a project", "query": "SHOW TABLES;"},
+            {"description": "Describe table structure", "query": "DESC table_name;"},
+            {
+                "description": "Query with partition",
+                "query": "SELECT * FROM table_name WHERE ds='20240101' LIMIT 10;",
+            },
+            {
+                "description": "Count rows in table",
+                "query": "SELECT COUNT(*) as row_count FROM table_name;",
+            },
+        ],
+        Platform.HOLOGRES: [
+            {
+                "description": "List all tables in schema",
+                "query": "SELECT tablename FROM pg_tables WHERE schemaname='public';",
+            },
+            {
+                "description": "Describe table columns",
+                "query": "SELECT column_name, data_type FROM information_schema.columns WHERE table_name='table_name';",
+            },
+            {
+                "description": "Sample data from table",
+                "query": "SELECT * FROM table_name LIMIT 10;",
+            },
+            {
+                "description": "Aggregate query",
+                "query": "SELECT category, COUNT(*) as cnt FROM table_name GROUP BY category LIMIT 100;",
+            },
+        ],
+        Platform.MYSQL: [
+            {"description": "Show all tables", "query": "SHOW TABLES;"},
+            {"description": "Describe table structure", "query": "DESCRIBE table_name;"},
+            {
+                "description": "Sample recent data",
+                "query": "SELECT * FROM table_name ORDER BY created_at DESC LIMIT 10;",
+            },
+            {
+                "description": "Count by category",
+                "query": "SELECT category, COUNT(*) as count FROM table_name GROUP BY category;",
+            },
+        ],
+        Platform.POLARDB: [
+            {"description": "Show databases", "query": "SHOW DATABASES;"},
+            {"description": "Show tables", "query": "SHOW TABLES;"},
+            {"description": "Table structure", "query": "SHOW CREATE TABLE table_name;"},
+            {
+                "description": "Recent records",
+                "query": "SELECT * FROM table_name ORDER BY id DESC LIMIT 10;",
+            },
+        ],
+        Platform.REDSHIFT: [
+            {
+                "description": "List tables in schema",
+                "query": "SELECT tablename FROM pg_tables WHERE schemaname='public';",
+            },
+            {
+                "description": "Table column details",
+                "query": "SELECT * FROM information_schema.columns WHERE table_name='table_name' LIMIT 100;",
+            },
+            {
+                "description": "Distribution and sort keys",
+                "query": "SELECT * FROM pg_table_def WHERE tablename='table_name';",
+            },
+            {"description": "Sample data", "query": "SELECT * FROM table_name LIMIT 10;"},
+        ],
+    }
+)
 
 
 class SQLDialectHelper:
@@ -18,116 +218,31 @@ class SQLDialectHelper:
         Returns:
             Dictionary with platform information
         """
-        platform_info = {
-            Platform.MAXCOMPUTE: {
-                "name": "MaxCompute",
-                "type": "Offline Data Warehouse",
-                "description": "Alibaba Cloud MaxCompute for offline DW tables and batch processing",
-                "dialect": "MaxCompute SQL (similar to Hive)",
-                "use_cases": ["Offline analytics", "Batch processing", "Data warehouse"],
-                "features": [
-                    "Partitioned tables",
-                    "Distributed processing",
-                    "UDF support",
-                    "Cost-based optimization",
-                ],
-                "common_functions": [
-                    "WCOUNT() - Word count",
-                    "GET_JSON_OBJECT() - Parse JSON",
-                    "CONCAT_WS() - Concatenate with separator",
-                    "TO_DATE() - Date conversion",
-                ],
-            },
-            Platform.HOLOGRES: {
-                "name": "Hologres",
-                "type": "Real-time Analytics",
-                "description": "Alibaba Cloud Hologres for real-time analytics and OLAP",
-                "dialect": "PostgreSQL-compatible",
-                "use_cases": ["Real-time analytics", "OLAP", "Interactive queries"],
-                "features": [
-                    "PostgreSQL compatible",
-                    "Real-time data serving",
-                    "High-performance queries",
-                    "Row and column storage",
-                ],
-                "common_functions": [
-                    "Standard PostgreSQL functions",
-                    "Window functions",
-                    "JSON functions",
-                    "Array functions",
-                ],
-            },
-            Platform.MYSQL: {
-                "name": "MySQL",
-                "type": "Source System",
-                "description": "MySQL database for source systems and transactional data",
-                "dialect": "MySQL",
-                "use_cases": ["OLTP", "Application databases", "Source data"],
-                "features": [
-                    "ACID transactions",
-                    "Stored procedures",
-                    "Triggers",
-                    "Full-text search",
-                ],
-                "common_functions": [
-                    "NOW() - Current timestamp",
-                    "CONCAT() - String concatenation",
-                    "DATE_FORMAT() - Format dates",
-                    "IFNULL() - Null handling",
-                ],
-            },
-            Platform.POLARDB: {
-                "name": "PolarDB",
-                "type": "Source System",
-                "description": "Alibaba Cloud PolarDB for MySQL-compatible source systems",
-                "dialect": "MySQL-compatible",
-                "use_cases": ["OLTP", "High-performance databases", "Source data"],
-                "features": [
-                    "MySQL compatible",
-                    "High performance",
-                    "Distributed storage",
-                    "Read replicas",
-                ],
-                "common_functions": [
-                    "MySQL-compatible functions",
-                    "JSON functions",
-                    "Full-text search",
-                    "GIS functions",
-                ],
-            },
-            Platform.REDSHIFT: {
-                "name": "Redshift",
-                "type": "Regional Data Warehouse",
-                "description": "AWS Redshift for EU data and regional analytics",
-                "dialect": "PostgreSQL-based",
-                "use_cases": ["Data warehouse", "Regional analytics", "EU data"],
-                "features": [
-                    "Columnar storage",
-                    "Massively parallel processing",
-                    "Distribution keys",
-                    "Sort keys",
-                ],
-                "common_functions": [
-                    "LISTAGG() - String aggregation",
-                    "MEDIAN() - Median calculation",
-                    "PERCENTILE_CONT() - Percentiles",
-                    "JSON_EXTRACT_PATH_TEXT() - JSON parsing",
-                ],
-            },
-        }
+        info = _PLATFORM_INFO.get(platform)
+        if info is None:
+            return {"name": platform, **_UNKNOWN_PLATFORM_INFO}
+        return info
 
-        return platform_info.get(
-            platform,
-            {
+    @staticmethod
+    def get_platform_summary(platform: str) -> Dict[str, Any]:
+        """
+        Get the short description of a platform shown by list_platforms.
+
+        Args:
+            platform: Platform name
+
+        Returns:
+            Dictionary with platform, name, type and description
+        """
+        summary = _PLATFORM_SUMMARY.get(platform)
+        if summary is None:
+            return {
+                "platform": platform,
                 "name": platform,
-                "type": "Unknown",
-                "description": "Unknown platform",
-                "dialect": "SQL",
-                "use_cases": [],
-                "features": [],
-                "common_functions": [],
-            },
-        )
+                "type": _UNKNOWN_PLATFORM_INFO["type"],
+                "description": _UNKNOWN_PLATFORM_INFO["description"],
+            }
+        return summary
 
     @staticmethod
     def get_example_queries(platform: str) -> list[Dict[str, str]]:
@@ -140,76 +255,7 @@ class SQLDialectHelper:
         Returns:
             List of example query dictionaries
         """
-        examples = {
-            Platform.MAXCOMPUTE: [
-                {"description": "List all tables in a project", "query": "SHOW TABLES;"},
-                {"description": "Describe table structure", "query": "DESC table_name;"},
-                {
-                    "description": "Query with partition",
-                    "query": "SELECT * FROM table_name WHERE ds='20240101' LIMIT 10;",
-                },
-                {
-                    "description": "Count rows in table",
-                    "query": "SELECT COUNT(*) as row_count FROM table_name;",
-                },
-            ],
-            Platform.HOLOGRES: [
-                {
-                    "description": "List all tables in schema",
-                    "query": "SELECT tablename FROM pg_tables WHERE schemaname='public';",
-                },
-                {
-                    "description": "Describe table columns",
-                    "query": "SELECT column_name, data_type FROM information_schema.columns WHERE table_name='table_name';",
-                },
-                {
-                    "description": "Sample data from table",
-                    "query": "SELECT * FROM table_name LIMIT 10;",
-                },
-                {
-                    "description": "Aggregate query",
-                    "query": "SELECT category, COUNT(*) as cnt FROM table_name GROUP BY category LIMIT 100;",
-                },
-            ],
-            Platform.MYSQL: [
-                {"description": "Show all tables", "query": "SHOW TABLES;"},
-                {"description": "Describe table structure", "query": "DESCRIBE table_name;"},
-                {
-                    "description": "Sample recent data",
-                    "query": "SELECT * FROM table_name ORDER BY created_at DESC LIMIT 10;",
-                },
-                {
-                    "description": "Count by category",
-                    "query": "SELECT category, COUNT(*) as count FROM table_name GROUP BY category;",
-                },
-            ],
-            Platform.POLARDB: [
-                {"description": "Show databases", "query": "SHOW DATABASES;"},
-                {"description": "Show tables", "query": "SHOW TABLES;"},
-                {"description": "Table structure", "query": "SHOW CREATE TABLE table_name;"},
-                {
-                    "description": "Recent records",
-                    "query": "SELECT * FROM table_name ORDER BY id DESC LIMIT 10;",
-                },
-            ],
-            Platform.REDSHIFT: [
-                {
-                    "description": "List tables in schema",
-                    "query": "SELECT tablename FROM pg_tables WHERE schemaname='public';",
-                },
-                {
-                    "description": "Table column details",
-                    "query": "SELECT * FROM information_schema.columns WHERE table_name='table_name' LIMIT 100;",
-                },
-                {
-                    "description": "Distribution and sort keys",
-                    "query": "SELECT * FROM pg_table_def WHERE tablename='table_name';",
-                },
-                {"description": "Sample data", "query": "SELECT * FROM table_name LIMIT 10;"},
-            ],
-        }
-
-        return examples.get(platform, [])
+        return _EXAMPLE_QUERIES.get(platform, [])
 
     @staticmethod
     def format_query_results(results: Dict[str, Any], format_type: str = "table") -> str:
@@ -227,9 +273,7 @@ class SQLDialectHelper:
             return f"Error: {results.get('error', 'Unknown error')}"
 
         if format_type == "json":
-            import json
-
-            return json.dumps(results, indent=2, default=str)
+            return dumps(results)
 
         if not results.get("rows"):
             return results.get("message", "Query executed successfully with no results")
@@ -241,20 +285,35 @@ class SQLDialectHelper:
         if not columns or not rows:
             return "No data returned"
 
-        # Calculate column widths
-        col_widths = {col: len(col) for col in columns}
-        for row in rows:
-            for col in columns:
-                val_len = len(str(row.get(col, "")))
-                col_widths[col] = max(col_widths[col], val_len)
+        if len(rows) == 1:
+            # Single row (e.g. a COUNT(*)): widths come straight from its cells
+            cells = [[str(val) for val in rows[0]]]
+            col_widths = [max(len(col), len(cell)) for col, cell in zip(columns, cells[0])]
+        else:
+            # Stringify every cell once (rows are tuples aligned with columns)
+            cells = [[str(val) for val in row] for row in rows]
+
+            # Calculate column widths column-wise over the stringified cells
+            col_widths = [
+                max(len(col), *map(len, col_cells))
+                for col, col_cells in zip(columns, zip(*cells))
+            ]
+
+        # One left-aligned, padded field per column, so each line is a single format call
+        line_fmt = " | ".join(f"{{:<{width}}}" for width in col_widths)
 
         # Build table
-        header = " | ".join(col.ljust(col_widths[col]) for col in columns)
-        separator = "-+-".join("-" * col_widths[col] for col in columns)
+        header = line_fmt.format(*columns)
+        separator = "-+-".join("-" * width for width in col_widths)
 
-        lines = [header, separator]
-        for row in rows:
-            line = " | ".join(str(row.get(col, "")).ljust(col_widths[col]) for col in columns)
-            lines.append(line)
+        # Write straight into one buffer rather than keeping a list of row strings
+        buf = io.StringIO()
+        buf.write(header)
+        buf.write("\n")
+        buf.write(separator)
+        for row_cells in cells:
+            buf.write("\n")
+            buf.write(line_fmt.format(*row_cells))
+        buf.write(f"\n\n({len(rows)} rows)")
 
-        return "\n".join(lines) + f"\n\n({len(rows)} rows)"
+        return buf.getvalue()
@@ -1,137 +1,308 @@
 """SQL safety checker to prevent destructive operations."""
 
 import re
-from typing import Tuple, List
+import functools
+from collections import namedtuple
+from typing import Tuple, List, Optional
 
+try:
+    import hyperscan
+except ImportError:  # Optional speedup; the precompiled alternation is used instead
+    hyperscan = None
 
-class SQLSafetyChecker:
-    """Checks SQL queries for destructive operations."""
-
-    # Destructive SQL keywords/patterns
-    DESTRUCTIVE_KEYWORDS = [
-        r"\bDROP\s+TABLE\b",
-        r"\bDROP\s+DATABASE\b",
-        r"\bDROP\s+SCHEMA\b",
-        r"\bTRUNCATE\b",
-        r"\bDELETE\s+FROM\b",
-        r"\bUPDATE\s+\w+\s+SET\b",
-        r"\bINSERT\s+INTO\b",
-        r"\bCREATE\s+TABLE\b",
-        r"\bCREATE\s+DATABASE\b",
-        r"\bCREATE\s+SCHEMA\b",
-        r"\bALTER\s+TABLE\b",
-        r"\bMERGE\s+INTO\b",
-    ]
-
-    @staticmethod
-    def is_destructive(query: str) -> Tuple[bool, List[str]]:
-        """
-        Check if a query contains destructive operations.
-
-        Args:
-            query: SQL query to check
-
-        Returns:
-            Tuple of (is_destructive, list of matched patterns)
-        """
-        query_upper = query.upper()
-        matched_patterns = []
-
-        for pattern in SQLSafetyChecker.DESTRUCTIVE_KEYWORDS:
-            if re.search(pattern, query_upper, re.IGNORECASE):
-                # Extract the matched keyword for reporting
-                match = re.search(pattern, query_upper, re.IGNORECASE)
-                if match:
-                    matched_patterns.append(match.group(0))
-
-        return len(matched_patterns) > 0, matched_patterns
-
-    @staticmethod
-    def is_select_query(query: str) -> bool:
-        """
-        Check if query is a SELECT statement.
-
-        Args:
-            query: SQL query to check
-
-        Returns:
-            True if query is a SELECT statement
-        """
-        query_stripped = query.strip().upper()
-        # Check for SELECT, WITH (CTE), or SHOW statements
-        return (
-            query_stripped.startswith("SELECT")
-            or query_stripped.startswith("WITH")
-            or query_stripped.startswith("SHOW")
-            or query_stripped.startswith("DESCRIBE")
-            or query_stripped.startswith("DESC")
-            or query_stripped.startswith("EXPLAIN")
+# Destructive SQL keywords/patterns
+DESTRUCTIVE_KEYWORDS = [
+    r"\bDROP\s+TABLE\b",
+    r"\bDROP\s+DATABASE\b",
+    r"\bDROP\s+SCHEMA\b",
+    r"\bTRUNCATE\b",
+    r"\bDELETE\s+FROM\b",
+    r"\bUPDATE\s+\w+\s+SET\b",
+    r"\bINSERT\s+INTO\b",
+    r"\bCREATE\s+TABLE\b",
+    r"\bCREATE\s+DATABASE\b",
+    r"\bCREATE\s+SCHEMA\b",
+    r"\bALTER\s+TABLE\b",
+    r"\bMERGE\s+INTO\b",
+]
+
+# All destructive patterns as one case-insensitive alternation, so a query is
+# scanned once instead of once (or twice) per pattern
+_DESTRUCTIVE_RE = re.compile(
+    "|".join(f"(?:{p})" for p in DESTRUCTIVE_KEYWORDS), re.IGNORECASE
+)
+
+# First keywords of read-only statements: SELECT, WITH (CTE), SHOW, DESCRIBE/DESC, EXPLAIN
+_SELECT_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "DESC", "EXPLAIN"})
+
+# First keywords of single statements that can never modify data. WITH is left out
+# because a CTE may end in INSERT/UPDATE/DELETE, and EXPLAIN because EXPLAIN ANALYZE
+# runs the statement it explains.
+_READ_ONLY_KEYWORDS = frozenset({"SELECT", "SHOW", "DESCRIBE", "DESC", "USE"})
+
+# The first word of a query, after any leading whitespace
+_FIRST_TOKEN_RE = re.compile(r"\s*(\w+)")
+
+# An existing LIMIT clause, whatever follows it (a number, a bind placeholder such
+# as ? / :n / %s, or ALL). Word boundaries keep names like rate_limit or LIMITED
+# from matching.
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def _compile_hyperscan_db() -> Optional["hyperscan.Database"]:
+    """Compile DESTRUCTIVE_KEYWORDS into a Hyperscan database, if Hyperscan is installed."""
+    if hyperscan is None:
+        return None
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode() for p in DESTRUCTIVE_KEYWORDS],
+        ids=list(range(len(DESTRUCTIVE_KEYWORDS))),
+        flags=[flags] * len(DESTRUCTIVE_KEYWORDS),
+    )
+    return db
+
+
+# Hyperscan scans all patterns in one linear DFA pass. Its \w and \b are ASCII-only
+# (Unicode mode rejects \b), so it is only used for ASCII queries, where it agrees
+# with re. The database owns a single scratch space, which is fine for the
+# single-threaded MCP event loop.
+_HS_DB = _compile_hyperscan_db()
+
+
+def _hyperscan_matches(query: str) -> List[str]:
+    """Return destructive matches found by Hyperscan, in order of appearance."""
+    data = query.encode("ascii")
+    spans = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans.append((start, end))
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+    return [data[start:end].decode("ascii") for start, end in sorted(spans)]
+
+
+def has_limit(query: str) -> bool:
+    """
+    Check if a query already has a LIMIT clause.
+
+    Shared by query validation and ConnectionManager.execute_query, so both
+    decide the same way whether to append one.
+
+    Args:
+        query: SQL query to check
+
+    Returns:
+        True if the query contains the LIMIT keyword
+    """
+    return _LIMIT_RE.search(query) is not None
+
+
+def _is_select(query: str) -> bool:
+    """Return True if the first word of the query is one of _SELECT_KEYWORDS."""
+    m = _FIRST_TOKEN_RE.match(query)
+    return m is not None and m.group(1).upper() in _SELECT_KEYWORDS
+
+
+# Queries validated by the MCP server are often repeated verbatim (retries, re-runs of
+# generated SQL), so scan results are memoized per query string. Long queries are rarely
+# repeated and would pin their full text in the cache, so they are always scanned afresh.
+_QUERY_CACHE_SIZE = 128
+_MAX_CACHED_QUERY_LEN = 4096
+
+
+def _scan_destructive(query: str) -> Tuple[str, ...]:
+    """Return each distinct destructive match once, upper-cased, in order of appearance."""
+    # Common case: a single read-only statement needs no pattern scan. Anything with a
+    # statement separator before the end could chain a destructive statement, so it
+    # is always scanned.
+    m = _FIRST_TOKEN_RE.match(query)
+    if (
+        m is not None
+        and m.group(1).upper() in _READ_ONLY_KEYWORDS
+        and ";" not in query.rstrip().rstrip(";")
+    ):
+        return ()
+
+    if _HS_DB is not None and query.isascii():
+        found = _hyperscan_matches(query)
+    else:
+        found = [m.group(0) for m in _DESTRUCTIVE_RE.finditer(query)]
+
+    return tuple(dict.fromkeys(text.upper() for text in found))
+
+
+_cached_destructive_matches = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(_scan_destructive)
+
+
+def _destructive_matches(query: str) -> Tuple[str, ...]:
+    """Return the destructive matches for a query, from the cache unless it is long."""
+    if len(query) > _MAX_CACHED_QUERY_LEN:
+        return _scan_destructive(query)
+    return _cached_destructive_matches(query)
+
+
+# Everything validate_query needs to know about a query, gathered in one pass
+_QueryAnalysis = namedtuple(
+    "_QueryAnalysis", ["is_destructive", "matches", "is_select", "has_limit", "stripped_no_semi"]
+)
+
+
+# Result of validate_query_details
+QueryValidation = namedtuple(
+    "QueryValidation", ["is_valid", "processed_query", "message", "is_select", "is_destructive"]
+)
+
+
+def _analyze_uncached(query: str) -> _QueryAnalysis:
+    """Strip and scan a query once, returning its destructive matches, type and LIMIT status."""
+    stripped = query.strip()
+    matches = _destructive_matches(query)
+    return _QueryAnalysis(
+        is_destructive=bool(matches),
+        matches=matches,
+        is_select=_is_select(stripped),
+        has_limit=has_limit(stripped),
+        stripped_no_semi=stripped.rstrip(";"),
+    )
+
+
+_cached_analyze = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(_analyze_uncached)
+
+
+def _analyze(query: str) -> _QueryAnalysis:
+    """Return the analysis for a query, from the cache unless it is long."""
+    if len(query) > _MAX_CACHED_QUERY_LEN:
+        return _analyze_uncached(query)
+    return _cached_analyze(query)
+
+
+def is_destructive(query: str) -> Tuple[bool, List[str]]:
+    """
+    Check if a query contains destructive operations.
+
+    Args:
+        query: SQL query to check
+
+    Returns:
+        Tuple of (is_destructive, list of matched patterns)
+    """
+    # A fresh list, so callers can't modify the cached matches
+    matched_patterns = list(_destructive_matches(query))
+
+    return len(matched_patterns) > 0, matched_patterns
+
+
+def is_select_query(query: str) -> bool:
+    """
+    Check if query is a SELECT statement.
+
+    Args:
+        query: SQL query to check
+
+    Returns:
+        True if query is a SELECT statement
+    """
+    # Check for SELECT, WITH (CTE), SHOW, DESCRIBE or EXPLAIN statements
+    return _is_select(query)
+
+
+def suggest_limit(query: str, default_limit: int = 100) -> str:
+    """
+    Add LIMIT clause to SELECT queries if not present.
+
+    Args:
+        query: SQL query
+        default_limit: Default limit to apply
+
+    Returns:
+        Query with LIMIT clause
+    """
+    # One (cached) analysis answers both "has LIMIT" and "is SELECT"
+    analysis = _analyze(query)
+
+    # Only add LIMIT to SELECT queries that don't already have one
+    if analysis.has_limit or not analysis.is_select:
+        return query
+
+    # Add LIMIT clause
+    return f"{analysis.stripped_no_semi} LIMIT {default_limit}"
+
+
+def validate_query(
+    query: str,
+    allow_destructive: bool = False,
+    auto_limit: bool = True,
+    default_limit: int = 100,
+) -> Tuple[bool, str, str]:
+    """
+    Validate a SQL query for safety.
+
+    Args:
+        query: SQL query to validate
+        allow_destructive: Whether to allow destructive operations
+        auto_limit: Whether to automatically add LIMIT to SELECT queries
+        default_limit: Default limit value
+
+    Returns:
+        Tuple of (is_valid, processed_query, message)
+    """
+    return validate_query_details(query, allow_destructive, auto_limit, default_limit)[:3]
+
+
+def validate_query_details(
+    query: str,
+    allow_destructive: bool = False,
+    auto_limit: bool = True,
+    default_limit: int = 100,
+) -> QueryValidation:
+    """
+    Validate a SQL query for safety, also reporting how it was classified.
+
+    Takes the same arguments as validate_query.
+
+    Returns:
+        QueryValidation of (is_valid, processed_query, message, is_select, is_destructive)
+    """
+    if not query or not query.strip():
+        return QueryValidation(False, query, "Empty query", False, False)
+
+    analysis = _analyze(query)
+
+    # Check for destructive operations
+    if analysis.is_destructive and not allow_destructive:
+        message = (
+            f"Destructive operation detected: {', '.join(analysis.matches)}. "
+            "This is a read-only assistant. Please confirm if you really want to execute this."
         )
+        return QueryValidation(False, query, message, analysis.is_select, True)
+
+    # Add LIMIT if applicable
+    processed_query = query
+    if auto_limit and analysis.is_select and not analysis.has_limit:
+        processed_query = f"{analysis.stripped_no_semi} LIMIT {default_limit}"
+
+    return QueryValidation(
+        True,
+        processed_query,
+        "Query validated successfully",
+        analysis.is_select,
+        analysis.is_destructive,
+    )
+
+
+class SQLSafetyChecker:
+    """Checks SQL queries for destructive operations.
+
+    Namespace over the module-level functions, kept for existing callers.
+    """
+
+    DESTRUCTIVE_KEYWORDS = DESTRUCTIVE_KEYWORDS
 
-    @staticmethod
-    def suggest_limit(query: str, default_limit: int = 100) -> str:
-        """
-        Add LIMIT clause to SELECT queries if not present.
-
-        Args:
-            query: SQL query
-            default_limit: Default limit to apply
-
-        Returns:
-            Query with LIMIT clause
-        """
-        query_upper = query.strip().upper()
-
-        # Check if query already has LIMIT
-        if "LIMIT" in query_upper:
-            return query
-
-        # Only add LIMIT to SELECT queries
-        if not SQLSafetyChecker.is_select_query(query):
-            return query
-
-        # Add LIMIT clause
-        query_clean = query.strip().rstrip(";")
-        return f"{query_clean} LIMIT {default_limit}"
-
-    @staticmethod
-    def validate_query(
-        query: str,
-        allow_destructive: bool = False,
-        auto_limit: bool = True,
-        default_limit: int = 100,
-    ) -> Tuple[bool, str, str]:
-        """
-        Validate a SQL query for safety.
-
-        Args:
-            query: SQL query to validate
-            allow_destructive: Whether to allow destructive operations
-            auto_limit: Whether to automatically add LIMIT to SELECT queries
-            default_limit: Default limit value
-
-        Returns:
-            Tuple of (is_valid, processed_query, message)
-        """
-        if not query or not query.strip():
-            return False, query, "Empty query"
-
-        # Check for destructive operations
-        is_destructive, patterns = SQLSafetyChecker.is_destructive(query)
-
-        if is_destructive and not allow_destructive:
-            return (
-                False,
-                query,
-                (
-                    f"Destructive operation detected: {', '.join(patterns)}. "
-                    "This is a read-only assistant. Please confirm if you really want to execute this."
-                ),
-            )
-
-        # Add LIMIT if applicable
-        processed_query = query
-        if auto_limit and SQLSafetyChecker.is_select_query(query):
-            processed_query = SQLSafetyChecker.suggest_limit(query, default_limit)
-
-        return True, processed_query, "Query validated successfully"
+    is_destructive = staticmethod(is_destructive)
+    is_select_query = staticmethod(is_select_query)
+    has_limit = staticmethod(has_limit)
+    suggest_limit = staticmethod(suggest_limit)
+    validate_query = staticmethod(validate_query)
+    validate_query_details = staticmethod(validate_query_details)
@@ -0,0 +1,66 @@
+"""JSON serialization helpers for MCP tool responses."""
+
+import base64
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+# Types json/orjson encode natively; everything else goes through to_jsonable.
+# float is handled separately, since NaN and ±Infinity aren't valid JSON
+_JSON_NATIVE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a database value to a JSON-native type.
+
+    Args:
+        value: Value from a result row
+
+    Returns:
+        The value unchanged if JSON-native; None for NaN/±Infinity floats (which
+        orjson writes as null); lists for lists/tuples (ARRAY columns) and dicts
+        for dicts (JSON/HSTORE columns), converted recursively; ISO string for
+        dates/times, base64 string for bytes, str() for anything else (e.g. Decimal)
+    """
+    if type(value) in _JSON_NATIVE_TYPES:
+        return value
+    if type(value) is float:
+        return value if math.isfinite(value) else None
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {
+            k if isinstance(k, str) else str(k): to_jsonable(v) for k, v in value.items()
+        }
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    return str(value)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a response to indented JSON, using orjson when installed.
+
+    Both paths emit non-ASCII characters as-is (like orjson) and send values
+    neither encoder handles natively through to_jsonable, so they produce the
+    same JSON data for to_jsonable-converted values (execute_query converts
+    every row value). The text can still differ in float formatting, e.g.
+    1e+16 (json) vs 1e16 (orjson).
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=to_jsonable, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, default=to_jsonable, ensure_ascii=False)
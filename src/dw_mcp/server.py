@@ -2,7 +2,6 @@
 """Data Warehouse MCP Server - Multi-platform SQL assistant."""
 
 import asyncio
-import json
 import sys
 from typing import Any
 from mcp.server import Server
@@ -17,20 +16,35 @@ from mcp.types import (
 import mcp.server.stdio
 
 from .config_loader import load_env_file
-from .connections import ConnectionManager
-from .safety import SQLSafetyChecker
+from .connections import Platform, get_connection_manager
+from .safety import validate_query, validate_query_details
 from .dialects import SQLDialectHelper
 from .startup_checks import run_startup_checks
+from .serialization import dumps
 
 # Try to load .env file (env vars take precedence)
 load_env_file()
 
 # Initialize connection manager
-conn_manager = ConnectionManager()
+conn_manager = get_connection_manager()
 
 # Create MCP server
 app = Server("dw-mcp")
 
+# Response content of the static per-platform tools, built once at import. The
+# TextContent objects are shared between calls and never modified.
+_PLATFORM_INFO_CONTENT = {
+    p.value: TextContent(type="text", text=dumps(SQLDialectHelper.get_platform_info(p)))
+    for p in Platform
+}
+_EXAMPLE_QUERIES_CONTENT = {
+    p.value: TextContent(
+        type="text",
+        text=dumps({"platform": p.value, "examples": SQLDialectHelper.get_example_queries(p)}),
+    )
+    for p in Platform
+}
+
 
 @app.list_prompts()
 async def list_prompts() -> list[Prompt]:
@@ -82,60 +96,78 @@ async def list_prompts() -> list[Prompt]:
     ]
 
 
+async def _prompt_explain_schema(arguments: dict[str, str]) -> GetPromptResult:
+    """Build the explain-schema prompt."""
+    platform = arguments.get("platform", "")
+    table = arguments.get("table", "")
+
+    return GetPromptResult(
+        description=f"Explaining schema for {table} on {platform}",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text=f"Please explain the schema and structure of table '{table}' on platform '{platform}'. Include column names, data types, and any constraints or indexes.",
+                ),
+            )
+        ],
+    )
+
+
+async def _prompt_data_lineage(arguments: dict[str, str]) -> GetPromptResult:
+    """Build the data-lineage prompt."""
+    table = arguments.get("table", "")
+
+    return GetPromptResult(
+        description=f"Explaining data lineage for {table}",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text=f"Please explain the data lineage for table '{table}'. Show upstream sources and downstream dependencies.",
+                ),
+            )
+        ],
+    )
+
+
+async def _prompt_query_optimization(arguments: dict[str, str]) -> GetPromptResult:
+    """Build the query-optimization prompt."""
+    platform = arguments.get("platform", "")
+    query = arguments.get("query", "")
+
+    return GetPromptResult(
+        description=f"Optimizing query for {platform}",
+        messages=[
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text=f"Please analyze this query for platform '{platform}' and suggest optimizations:\n\n{query}",
+                ),
+            )
+        ],
+    )
+
+
+# Prompt name -> handler
+_PROMPT_HANDLERS = {
+    "explain-schema": _prompt_explain_schema,
+    "data-lineage": _prompt_data_lineage,
+    "query-optimization": _prompt_query_optimization,
+}
+
+
 @app.get_prompt()
 async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptResult:
     """Get a specific prompt template."""
-    if name == "explain-schema":
-        platform = arguments.get("platform", "") if arguments else ""
-        table = arguments.get("table", "") if arguments else ""
-
-        return GetPromptResult(
-            description=f"Explaining schema for {table} on {platform}",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"Please explain the schema and structure of table '{table}' on platform '{platform}'. Include column names, data types, and any constraints or indexes.",
-                    ),
-                )
-            ],
-        )
-
-    elif name == "data-lineage":
-        table = arguments.get("table", "") if arguments else ""
-
-        return GetPromptResult(
-            description=f"Explaining data lineage for {table}",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"Please explain the data lineage for table '{table}'. Show upstream sources and downstream dependencies.",
-                    ),
-                )
-            ],
-        )
-
-    elif name == "query-optimization":
-        platform = arguments.get("platform", "") if arguments else ""
-        query = arguments.get("query", "") if arguments else ""
-
-        return GetPromptResult(
-            description=f"Optimizing query for {platform}",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"Please analyze this query for platform '{platform}' and suggest optimizations:\n\n{query}",
-                    ),
-                )
-            ],
-        )
+    handler = _PROMPT_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown prompt: {name}")
 
-    raise ValueError(f"Unknown prompt: {name}")
+    return await handler(arguments or {})
 
 
 @app.list_tools()
@@ -188,6 +220,11 @@ async def list_tools() -> list[Tool]:
                         "description": "Explicitly allow destructive operations (DELETE, UPDATE, DROP, etc.)",
                         "default": False,
                     },
+                    "include_raw_json": {
+                        "type": "boolean",
+                        "description": "Also return the full result as JSON after the table",
+                        "default": False,
+                    },
                 },
                 "required": ["platform", "query"],
             },
@@ -246,112 +283,131 @@ async def list_tools() -> list[Tool]:
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
+async def _tool_list_platforms(arguments: Any) -> list[TextContent]:
+    """Handle the list_platforms tool."""
+    platforms = conn_manager.list_available_platforms()
+
+    if not platforms:
+        response = {
+            "available_platforms": [],
+            "message": "No platforms configured. Set environment variables for connections.",
+            "env_vars": [
+                "MAXCOMPUTE_CONNECTION",
+                "HOLOGRES_CONNECTION",
+                "MYSQL_CONNECTION",
+                "POLARDB_CONNECTION",
+                "REDSHIFT_CONNECTION",
+            ],
+        }
+    else:
+        platform_details = [SQLDialectHelper.get_platform_summary(p) for p in platforms]
+
+        response = {"available_platforms": platforms, "details": platform_details}
+
+    return [TextContent(type="text", text=dumps(response))]
 
-    if name == "list_platforms":
-        platforms = conn_manager.list_available_platforms()
-
-        if not platforms:
-            response = {
-                "available_platforms": [],
-                "message": "No platforms configured. Set environment variables for connections.",
-                "env_vars": [
-                    "MAXCOMPUTE_CONNECTION",
-                    "HOLOGRES_CONNECTION",
-                    "MYSQL_CONNECTION",
-                    "POLARDB_CONNECTION",
-                    "REDSHIFT_CONNECTION",
-                ],
-            }
-        else:
-            platform_details = []
-            for p in platforms:
-                info = SQLDialectHelper.get_platform_info(p)
-                platform_details.append(
-                    {
-                        "platform": p,
-                        "name": info.get("name"),
-                        "type": info.get("type"),
-                        "description": info.get("description"),
-                    }
-                )
-
-            response = {"available_platforms": platforms, "details": platform_details}
-
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
-
-    elif name == "get_platform_info":
-        platform = arguments.get("platform")
+
+async def _tool_get_platform_info(arguments: Any) -> list[TextContent]:
+    """Handle the get_platform_info tool."""
+    platform = arguments.get("platform")
+    content = _PLATFORM_INFO_CONTENT.get(platform)
+    if content is None:
         info = SQLDialectHelper.get_platform_info(platform)
+        content = TextContent(type="text", text=dumps(info))
 
-        return [TextContent(type="text", text=json.dumps(info, indent=2))]
+    return [content]
 
-    elif name == "execute_query":
-        platform = arguments.get("platform")
-        query = arguments.get("query")
-        limit = arguments.get("limit", 100)
-        allow_destructive = arguments.get("allow_destructive", False)
 
-        # Validate query first
-        is_valid, processed_query, message = SQLSafetyChecker.validate_query(
-            query, allow_destructive=allow_destructive, auto_limit=True, default_limit=limit
-        )
+async def _tool_execute_query(arguments: Any) -> list[TextContent]:
+    """Handle the execute_query tool."""
+    platform = arguments.get("platform")
+    query = arguments.get("query")
+    limit = arguments.get("limit", 100)
+    allow_destructive = arguments.get("allow_destructive", False)
 
-        if not is_valid:
-            response = {"success": False, "error": message, "query": query}
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    # Validate query first
+    is_valid, processed_query, message = validate_query(
+        query, allow_destructive=allow_destructive, auto_limit=True, default_limit=limit
+    )
 
-        # Execute query
-        result = conn_manager.execute_query(platform, processed_query, limit=None)
+    if not is_valid:
+        response = {"success": False, "error": message, "query": query}
+        return [TextContent(type="text", text=dumps(response))]
 
-        # Format output
-        formatted = SQLDialectHelper.format_query_results(result, format_type="table")
+    # Execute query
+    result = conn_manager.execute_query(platform, processed_query, limit=None)
 
-        return [
-            TextContent(type="text", text=formatted),
-            TextContent(
-                type="text", text=f"\n\nRaw JSON:\n{json.dumps(result, indent=2, default=str)}"
-            ),
-        ]
+    # Format output
+    formatted = SQLDialectHelper.format_query_results(result, format_type="table")
 
-    elif name == "validate_query":
-        query = arguments.get("query")
-        allow_destructive = arguments.get("allow_destructive", False)
+    content = [TextContent(type="text", text=formatted)]
+    if arguments.get("include_raw_json", False):
+        content.append(TextContent(type="text", text=f"\n\nRaw JSON:\n{dumps(result)}"))
 
-        is_valid, processed_query, message = SQLSafetyChecker.validate_query(
-            query, allow_destructive=allow_destructive, auto_limit=True
-        )
+    return content
 
-        response = {
-            "valid": is_valid,
-            "message": message,
-            "original_query": query,
-            "processed_query": processed_query if is_valid else None,
-            "is_select": SQLSafetyChecker.is_select_query(query),
-            "is_destructive": SQLSafetyChecker.is_destructive(query)[0],
-        }
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+async def _tool_validate_query(arguments: Any) -> list[TextContent]:
+    """Handle the validate_query tool."""
+    query = arguments.get("query")
+    allow_destructive = arguments.get("allow_destructive", False)
+
+    validation = validate_query_details(
+        query, allow_destructive=allow_destructive, auto_limit=True
+    )
+
+    response = {
+        "valid": validation.is_valid,
+        "message": validation.message,
+        "original_query": query,
+        "processed_query": validation.processed_query if validation.is_valid else None,
+        "is_select": validation.is_select,
+        "is_destructive": validation.is_destructive,
+    }
 
-    elif name == "get_schema_info":
-        platform = arguments.get("platform")
-        schema = arguments.get("schema")
+    return [TextContent(type="text", text=dumps(response))]
 
-        result = conn_manager.get_schema_info(platform, schema)
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+async def _tool_get_schema_info(arguments: Any) -> list[TextContent]:
+    """Handle the get_schema_info tool."""
+    platform = arguments.get("platform")
+    schema = arguments.get("schema")
 
-    elif name == "get_example_queries":
-        platform = arguments.get("platform")
+    result = conn_manager.get_schema_info(platform, schema)
+
+    return [TextContent(type="text", text=dumps(result))]
+
+
+async def _tool_get_example_queries(arguments: Any) -> list[TextContent]:
+    """Handle the get_example_queries tool."""
+    platform = arguments.get("platform")
+    content = _EXAMPLE_QUERIES_CONTENT.get(platform)
+    if content is None:
         examples = SQLDialectHelper.get_example_queries(platform)
+        content = TextContent(type="text", text=dumps({"platform": platform, "examples": examples}))
+
+    return [content]
+
 
-        response = {"platform": platform, "examples": examples}
+# Tool name -> handler
+_TOOL_HANDLERS = {
+    "list_platforms": _tool_list_platforms,
+    "get_platform_info": _tool_get_platform_info,
+    "execute_query": _tool_execute_query,
+    "validate_query": _tool_validate_query,
+    "get_schema_info": _tool_get_schema_info,
+    "get_example_queries": _tool_get_example_queries,
+}
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
 
-    raise ValueError(f"Unknown tool: {name}")
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls."""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return await handler(arguments or {})
 
 
 async def main():
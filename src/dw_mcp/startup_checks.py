@@ -3,15 +3,99 @@
 import os
 import sys
 import re
-import shutil
-import subprocess
-from typing import Optional, List, Tuple
+import functools
+from collections import namedtuple
+from itertools import groupby
+from importlib.util import find_spec
+from typing import Optional, Dict, List, Tuple
 
+# The running interpreter never changes, so its version check is done once at import
+_PY_VERSION_STR = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_PY310_OK = sys.version_info >= (3, 10)
 
+# Versioned interpreter commands to look for on PATH, newest first
+_PYTHON_CANDIDATES = (
+    ('python3.12', (3, 12)),
+    ('python3.11', (3, 11)),
+    ('python3.10', (3, 10)),
+)
+
+# Version encoded in an interpreter file name, e.g. python3.12
+_VERSIONED_NAME_RE = re.compile(r'python(\d+)\.(\d+)')
+
+# (import name, pip requirement) of every required dependency
+_REQUIRED_DEPS: Tuple[Tuple[str, str], ...] = (
+    ('mcp', 'mcp>=0.9.0'),
+    ('sqlalchemy', 'sqlalchemy>=2.0.0'),
+    ('pymysql', 'pymysql>=1.1.0'),
+    ('psycopg2', 'psycopg2-binary>=2.9.0'),
+    ('redshift_connector', 'redshift-connector>=2.0.0'),
+    ('sqlalchemy_redshift', 'sqlalchemy-redshift>=0.8.0'),
+    ('odps', 'pyodps>=0.11.0'),
+)
+
+# Message blocks, each written with a single print
+_PY_TOO_LOW_MSG = """\
+❌ Python version too low
+   Current: {current}
+   Required: >=3.10
+
+解决方案 (Solutions):
+{solutions}"""
+
+_USE_EXISTING_PYTHON_MSG = """\
+1. Use existing Python 3.10+:
+   {python_cmd} -m src.dw_mcp.server"""
+
+_INSTALL_PYTHON_MSG = """\
+1. Install Python 3.10+:
+   macOS: brew install python@3.10
+   Ubuntu: sudo apt install python3.10
+   Windows: Download from python.org
+
+2. Or use pyenv:
+   pyenv install 3.10.0
+   pyenv local 3.10.0"""
+
+_MISSING_DEPS_MSG = """\
+❌ Missing dependencies:{packages}
+
+解决方案 (Solutions):
+1. Install missing dependencies:
+   pip install {requirements}
+
+2. Or install all dependencies:
+   pip install -r requirements.txt"""
+
+# Set to 1 to skip all startup checks and the banner
+_SKIP_CHECKS_VAR = 'DW_MCP_SKIP_CHECKS'
+
+_NO_PLATFORMS_MSG = """
+⚠️  No platforms configured
+
+To configure platforms, set environment variables:
+  - MAXCOMPUTE_* or DATAWORKS_*
+  - HOLOGRES_* or HOLO_*
+  - MYSQL_*
+  - POLARDB_*
+  - REDSHIFT_*
+
+See README.md for configuration examples."""
+
+# Environment keys that auto_fix_config may act on: <PREFIX>_..._<SUFFIX>
+_ENV_FIX_RE = re.compile(
+    r'^(DATAWORKS|HOLOGRES|HOLO|REDSHIFT|MYSQL|POLARDB)_(?:.*_)?(REGION|HOST|TYPE)$'
+)
+
+
+@functools.lru_cache(maxsize=1)
 def find_python310() -> Optional[str]:
     """
     Find a Python 3.10+ installation.
     
+    The result is cached, since installed interpreters don't change while the
+    server runs.
+    
     Returns:
         Path to Python 3.10+ executable, or None if not found
     """
@@ -19,31 +103,41 @@ def find_python310() -> Optional[str]:
     if sys.version_info >= (3, 10):
         return sys.executable
     
-    # Try to find other Python versions
-    for version in ['3.12', '3.11', '3.10']:
-        python_cmd = f'python{version}'
-        if shutil.which(python_cmd):
-            try:
-                result = subprocess.run(
-                    [python_cmd, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    # Parse version
-                    version_str = result.stdout.strip()
-                    match = re.search(r'(\d+)\.(\d+)', version_str)
-                    if match:
-                        major, minor = int(match.group(1)), int(match.group(2))
-                        if major == 3 and minor >= 10:
-                            return python_cmd
-            except Exception:
-                continue
+    # Only needed on this cold path; keeps it out of the server's import time
+    import shutil
+    
+    # A versioned command name states its version, so no child process is needed
+    for python_cmd, version in _PYTHON_CANDIDATES:
+        if version >= (3, 10) and shutil.which(python_cmd):
+            return python_cmd
+    
+    # Unversioned commands are usually symlinks to a versioned binary
+    for python_cmd in ('python3', 'python'):
+        path = shutil.which(python_cmd)
+        if path:
+            version = _version_from_path(path)
+            if version and version >= (3, 10):
+                return python_cmd
     
     return None
 
 
+def _version_from_path(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Read the (major, minor) version from an interpreter's resolved file name.
+    
+    Args:
+        path: Path to a Python executable, possibly a symlink
+    
+    Returns:
+        (major, minor), or None if the resolved name has no version in it
+    """
+    match = _VERSIONED_NAME_RE.search(os.path.basename(os.path.realpath(path)))
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
 def check_python_version() -> bool:
     """
     Check if Python version is 3.10 or higher.
@@ -51,32 +145,19 @@ def check_python_version() -> bool:
     Returns:
         True if version is adequate, False otherwise
     """
-    current_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    if _PY310_OK:
+        print(f"✓ Python version: {_PY_VERSION_STR}")
+        return True
     
-    if sys.version_info < (3, 10):
-        print("❌ Python version too low")
-        print(f"   Current: {current_version}")
-        print(f"   Required: >=3.10")
-        print("\n解决方案 (Solutions):")
-        
-        # Try to find a suitable Python version
-        python_cmd = find_python310()
-        if python_cmd and python_cmd != sys.executable:
-            print(f"1. Use existing Python 3.10+:")
-            print(f"   {python_cmd} -m src.dw_mcp.server")
-        else:
-            print("1. Install Python 3.10+:")
-            print("   macOS: brew install python@3.10")
-            print("   Ubuntu: sudo apt install python3.10")
-            print("   Windows: Download from python.org")
-            print("\n2. Or use pyenv:")
-            print("   pyenv install 3.10.0")
-            print("   pyenv local 3.10.0")
-        
-        return False
+    # Try to find a suitable Python version
+    python_cmd = find_python310()
+    if python_cmd and python_cmd != sys.executable:
+        solutions = _USE_EXISTING_PYTHON_MSG.format(python_cmd=python_cmd)
+    else:
+        solutions = _INSTALL_PYTHON_MSG
     
-    print(f"✓ Python version: {current_version}")
-    return True
+    print(_PY_TOO_LOW_MSG.format(current=_PY_VERSION_STR, solutions=solutions))
+    return False
 
 
 def check_dependencies() -> bool:
@@ -86,38 +167,77 @@ def check_dependencies() -> bool:
     Returns:
         True if all dependencies are installed, False otherwise
     """
-    REQUIRED_DEPS = {
-        'mcp': 'mcp>=0.9.0',
-        'sqlalchemy': 'sqlalchemy>=2.0.0',
-        'pymysql': 'pymysql>=1.1.0',
-        'psycopg2': 'psycopg2-binary>=2.9.0',
-        'redshift_connector': 'redshift-connector>=2.0.0',
-        'sqlalchemy_redshift': 'sqlalchemy-redshift>=0.8.0',
-        'odps': 'pyodps>=0.11.0',
-    }
-    
-    missing = []
-    for module, package in REQUIRED_DEPS.items():
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(package)
+    # Only locate each package; importing it would run its whole __init__
+    missing = [
+        package
+        for module, package in _REQUIRED_DEPS
+        if module not in sys.modules and find_spec(module) is None
+    ]
     
     if missing:
-        print("❌ Missing dependencies:")
-        for pkg in missing:
-            print(f"   - {pkg}")
-        print("\n解决方案 (Solutions):")
-        print("1. Install missing dependencies:")
-        print(f"   pip install {' '.join(missing)}")
-        print("\n2. Or install all dependencies:")
-        print("   pip install -r requirements.txt")
+        print(_MISSING_DEPS_MSG.format(
+            packages="".join(f"\n   - {pkg}" for pkg in missing),
+            requirements=" ".join(missing),
+        ))
         return False
     
     print("✓ All dependencies installed")
     return True
 
 
+# A fix to apply to the environment: (key, value, description)
+_EnvFix = Tuple[str, str, str]
+
+# Result of auto_fix_config_details
+FixResult = namedtuple('FixResult', ['messages', 'fixed_keys'])
+
+
+def _fix_dataworks_endpoint(env: Dict[str, str], key: str, value: str) -> Optional[_EnvFix]:
+    """Generate a missing DATAWORKS ENDPOINT from its REGION."""
+    # DATAWORKS_HK_BDW_REGION -> DATAWORKS_HK_BDW_ENDPOINT (needs an instance name)
+    if key.count('_') < 3:
+        return None
+    endpoint_key = f'{key[:-len("_REGION")]}_ENDPOINT'
+    if endpoint_key in env:
+        return None
+    # Generate endpoint based on region
+    return (
+        endpoint_key,
+        f'http://service.{value}.maxcompute.aliyun.com/api',
+        f'Generated {endpoint_key}',
+    )
+
+
+def _fix_hologres_type(env: Dict[str, str], key: str, value: str) -> Optional[_EnvFix]:
+    """Add a missing HOLOGRES TYPE next to a HOST."""
+    # HOLO_HK_CHATBI_HOST -> HOLO_HK_CHATBI_TYPE
+    type_key = f'{key[:-len("_HOST")]}_TYPE'
+    if type_key in env:
+        return None
+    return type_key, 'HOLOGRES', f'Added {type_key}=HOLOGRES'
+
+
+def _fix_type_case(env: Dict[str, str], key: str, value: str) -> Optional[_EnvFix]:
+    """Upper-case a TYPE value that only differs from its prefix in case."""
+    # REDSHIFT_EU_AVBU_TYPE=redshift -> REDSHIFT
+    expected = key.split('_', 1)[0]
+    if not value or value == expected or value.lower() != expected.lower():
+        return None
+    return key, expected, f'Fixed {key} (lowercase → {expected})'
+
+
+# (key prefix, key suffix) -> fixer; each fixer gets the environment snapshot and
+# returns the (key, value, description) of the fix to apply, or None
+_ENV_FIXERS = {
+    ('DATAWORKS', 'REGION'): _fix_dataworks_endpoint,
+    ('HOLO', 'HOST'): _fix_hologres_type,
+    ('HOLOGRES', 'HOST'): _fix_hologres_type,
+    ('REDSHIFT', 'TYPE'): _fix_type_case,
+    ('MYSQL', 'TYPE'): _fix_type_case,
+    ('POLARDB', 'TYPE'): _fix_type_case,
+}
+
+
 def auto_fix_config() -> List[str]:
     """
     Auto-fix common configuration issues.
@@ -125,59 +245,44 @@ def auto_fix_config() -> List[str]:
     Returns:
         List of fixes applied
     """
+    return auto_fix_config_details().messages
+
+
+def auto_fix_config_details() -> FixResult:
+    """
+    Auto-fix common configuration issues, also reporting which env keys were set.
+    
+    Returns:
+        FixResult of (descriptions of the fixes applied, set of env keys they set)
+    """
     fixes = []
+    updates = {}
+    
+    # One pass over a plain-dict snapshot of the environment; the fixes only add
+    # keys or rewrite the TYPE keys themselves, so none of them depends on another
+    env = dict(os.environ)
+    for key, value in env.items():
+        match = _ENV_FIX_RE.match(key)
+        if match is None:
+            continue
+        
+        fixer = _ENV_FIXERS.get(match.groups())
+        if fixer is not None:
+            fix = fixer(env, key, value)
+            if fix:
+                fix_key, fix_value, description = fix
+                updates[fix_key] = fix_value
+                fixes.append(description)
     
-    # Fix 1: Generate DATAWORKS ENDPOINT from REGION
-    for key in list(os.environ.keys()):
-        if key.startswith('DATAWORKS_') and key.endswith('_REGION'):
-            # Extract instance identifier
-            parts = key.split('_')
-            if len(parts) >= 4:
-                # DATAWORKS_HK_BDW_REGION -> DATAWORKS_HK_BDW
-                instance_prefix = '_'.join(parts[:-1])
-                endpoint_key = f'{instance_prefix}_ENDPOINT'
-                
-                if endpoint_key not in os.environ:
-                    region = os.environ[key]
-                    # Generate endpoint based on region
-                    endpoint = f'http://service.{region}.maxcompute.aliyun.com/api'
-                    os.environ[endpoint_key] = endpoint
-                    fixes.append(f'Generated {endpoint_key}')
-    
-    # Fix 2: Add missing HOLOGRES TYPE
-    for key in list(os.environ.keys()):
-        if (key.startswith('HOLO_') or key.startswith('HOLOGRES_')) and key.endswith('_HOST'):
-            # HOLO_HK_CHATBI_HOST -> HOLO_HK_CHATBI_TYPE
-            type_key = key.replace('_HOST', '_TYPE')
-            if type_key not in os.environ:
-                os.environ[type_key] = 'HOLOGRES'
-                fixes.append(f'Added {type_key}=HOLOGRES')
-    
-    # Fix 3: Fix REDSHIFT TYPE case (lowercase to uppercase)
-    for key in list(os.environ.keys()):
-        if key.startswith('REDSHIFT_') and key.endswith('_TYPE'):
-            value = os.environ[key]
-            if value and value.lower() == 'redshift' and value != 'REDSHIFT':
-                os.environ[key] = 'REDSHIFT'
-                fixes.append(f'Fixed {key} (lowercase → REDSHIFT)')
-    
-    # Fix 4: Fix MYSQL TYPE case
-    for key in list(os.environ.keys()):
-        if key.startswith('MYSQL_') and key.endswith('_TYPE'):
-            value = os.environ[key]
-            if value and value.lower() == 'mysql' and value != 'MYSQL':
-                os.environ[key] = 'MYSQL'
-                fixes.append(f'Fixed {key} (lowercase → MYSQL)')
-    
-    # Fix 5: Fix POLARDB TYPE case
-    for key in list(os.environ.keys()):
-        if key.startswith('POLARDB_') and key.endswith('_TYPE'):
-            value = os.environ[key]
-            if value and value.lower() == 'polardb' and value != 'POLARDB':
-                os.environ[key] = 'POLARDB'
-                fixes.append(f'Fixed {key} (lowercase → POLARDB)')
-    
-    return fixes
+    # Write all fixes back to the real environment at once
+    os.environ.update(updates)
+    
+    return FixResult(fixes, set(updates))
+
+
+def _platform_type(platform: str) -> str:
+    """Extract the platform type from an instance key (mysql_cn_test -> MYSQL)."""
+    return platform.split('_', 1)[0].upper()
 
 
 def print_startup_banner(conn_manager) -> None:
@@ -187,58 +292,58 @@ def print_startup_banner(conn_manager) -> None:
     Args:
         conn_manager: ConnectionManager instance
     """
-    platforms = conn_manager.list_available_platforms()
+    # Broken configs are listed too, marked ✗, so they don't silently disappear
+    unavailable = set(conn_manager.list_unavailable_platforms())
+    platforms = [*conn_manager.list_available_platforms(), *unavailable]
     
-    print("=" * 70)
-    print("MCP Server Started Successfully! 🚀")
-    print("=" * 70)
+    # Collect the banner lines and print them in one go
+    lines = ["=" * 70, "MCP Server Started Successfully! 🚀", "=" * 70]
     
     if not platforms:
-        print("\n⚠️  No platforms configured")
-        print("\nTo configure platforms, set environment variables:")
-        print("  - MAXCOMPUTE_* or DATAWORKS_*")
-        print("  - HOLOGRES_* or HOLO_*")
-        print("  - MYSQL_*")
-        print("  - POLARDB_*")
-        print("  - REDSHIFT_*")
-        print("\nSee README.md for configuration examples.")
+        lines.append(_NO_PLATFORMS_MSG)
     else:
-        print(f"\nConfigured Platform Instances ({len(platforms)}):\n")
-        
-        # Group by platform type
-        by_type = {}
-        for platform in platforms:
-            # Extract platform type from instance key
-            platform_type = platform.split('_')[0].upper()
-            if platform_type not in by_type:
-                by_type[platform_type] = []
-            by_type[platform_type].append(platform)
+        lines.append(f"\nConfigured Platform Instances ({len(platforms)}):\n")
         
-        # Print grouped platforms
-        for platform_type in sorted(by_type.keys()):
-            print(f"  {platform_type}:")
-            for platform in sorted(by_type[platform_type]):
-                # Try to get engine to check status
-                engine = conn_manager.get_engine(platform)
-                status = "✓" if engine else "✗"
-                print(f"    {status} {platform}")
-            print()
+        # Sort once by (platform type, instance key) and group by platform type
+        ordered = sorted(platforms, key=lambda p: (_platform_type(p), p))
+        for platform_type, group in groupby(ordered, key=_platform_type):
+            lines.append(f"  {platform_type}:")
+            for platform in group:
+                # Engines are created on first use; don't connect just to print a status
+                if platform in unavailable:
+                    lines.append(f"    ✗ {platform} (incomplete configuration or engine error)")
+                elif conn_manager.is_engine_cached(platform):
+                    lines.append(f"    ✓ {platform}")
+                else:
+                    lines.append(f"    ○ {platform} (connects on first use)")
+            lines.append("")
     
-    print("Server is waiting for MCP client connections...")
-    print("=" * 70)
-    print()
+    lines += [
+        "Server is waiting for MCP client connections...",
+        f"(Set {_SKIP_CHECKS_VAR}=1 to skip these startup checks on restart)",
+        "=" * 70,
+        "",
+    ]
+    print("\n".join(lines))
 
 
 def run_startup_checks(conn_manager=None) -> bool:
     """
     Run all startup checks and configuration fixes.
     
+    Setting DW_MCP_SKIP_CHECKS=1 skips every check (and the banner), for
+    supervisors that restart the server often in an already validated
+    environment.
+    
     Args:
         conn_manager: Optional ConnectionManager instance for status display
     
     Returns:
         True if all critical checks pass, False otherwise
     """
+    if os.environ.get(_SKIP_CHECKS_VAR) == '1':
+        return True
+    
     print("Running startup checks...\n")
     
     # Check 1: Python version
@@ -255,13 +360,10 @@ def run_startup_checks(conn_manager=None) -> bool:
     fixes = auto_fix_config()
     
     if fixes:
-        print("⚠️  Configuration issues detected and auto-fixed:")
-        for fix in fixes:
-            print(f"   ✓ {fix}")
+        applied = "".join(f"\n   ✓ {fix}" for fix in fixes)
+        print(f"⚠️  Configuration issues detected and auto-fixed:{applied}\n")
     else:
-        print("✓ Configuration looks good")
-    
-    print()
+        print("✓ Configuration looks good\n")
     
     # Print startup banner if connection manager provided
     if conn_manager:
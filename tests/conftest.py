@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import os
+import pytest
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Replace os.environ with an empty dict for the test and return it."""
+    environ = {}
+    monkeypatch.setattr(os, "environ", environ)
+    return environ
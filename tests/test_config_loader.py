@@ -3,10 +3,18 @@
 import os
 import pytest
 from pathlib import Path
-from src.dw_mcp.config_loader import load_env_file
+from src.dw_mcp.config_loader import load_env_file, reset_env_cache
 
 
-def test_load_env_file_basic(tmp_path):
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    """Run each test against a throwaway copy of os.environ."""
+    # monkeypatch.delenv doesn't record keys that were absent, so variables
+    # loaded from .env files would otherwise leak into later tests
+    monkeypatch.setattr(os, 'environ', os.environ.copy())
+
+
+def test_load_env_file_basic(tmp_path, monkeypatch):
     """Test loading a basic .env file."""
     # Create a temporary .env file
     env_file = tmp_path / '.env'
@@ -21,8 +29,7 @@ TEST_VAR4=value with spaces
     
     # Clear any existing env vars
     for key in ['TEST_VAR1', 'TEST_VAR2', 'TEST_VAR3', 'TEST_VAR4']:
-        if key in os.environ:
-            del os.environ[key]
+        monkeypatch.delenv(key, raising=False)
     
     # Load the file
     result = load_env_file(str(env_file))
@@ -32,11 +39,6 @@ TEST_VAR4=value with spaces
     assert os.environ.get('TEST_VAR2') == 'value2'
     assert os.environ.get('TEST_VAR3') == 'value3'
     assert os.environ.get('TEST_VAR4') == 'value with spaces'
-    
-    # Cleanup
-    for key in ['TEST_VAR1', 'TEST_VAR2', 'TEST_VAR3', 'TEST_VAR4']:
-        if key in os.environ:
-            del os.environ[key]
 
 
 def test_load_env_file_not_found():
@@ -45,14 +47,14 @@ def test_load_env_file_not_found():
     assert result is False
 
 
-def test_load_env_file_env_vars_take_precedence(tmp_path):
+def test_load_env_file_env_vars_take_precedence(tmp_path, monkeypatch):
     """Test that existing env vars take precedence over .env file."""
     # Create a temporary .env file
     env_file = tmp_path / '.env'
     env_file.write_text('TEST_PRECEDENCE=from_file')
     
     # Set an env var
-    os.environ['TEST_PRECEDENCE'] = 'from_env'
+    monkeypatch.setenv('TEST_PRECEDENCE', 'from_env')
     
     # Load the file
     result = load_env_file(str(env_file))
@@ -60,12 +62,9 @@ def test_load_env_file_env_vars_take_precedence(tmp_path):
     assert result is True
     # Should keep the env var value, not the file value
     assert os.environ.get('TEST_PRECEDENCE') == 'from_env'
-    
-    # Cleanup
-    del os.environ['TEST_PRECEDENCE']
 
 
-def test_load_env_file_empty_lines_and_comments(tmp_path):
+def test_load_env_file_empty_lines_and_comments(tmp_path, monkeypatch):
     """Test that empty lines and comments are handled correctly."""
     env_file = tmp_path / '.env'
     env_file.write_text('''
@@ -77,55 +76,88 @@ TEST_VALID=valid_value
 # Comment in between
 ''')
     
-    if 'TEST_VALID' in os.environ:
-        del os.environ['TEST_VALID']
+    monkeypatch.delenv('TEST_VALID', raising=False)
     
     result = load_env_file(str(env_file))
     
     assert result is True
     assert os.environ.get('TEST_VALID') == 'valid_value'
-    
-    # Cleanup
-    if 'TEST_VALID' in os.environ:
-        del os.environ['TEST_VALID']
 
 
-def test_load_env_file_equals_in_value(tmp_path):
+def test_load_env_file_equals_in_value(tmp_path, monkeypatch):
     """Test handling values with = character."""
     env_file = tmp_path / '.env'
     env_file.write_text('TEST_EQUALS=value=with=equals')
     
-    if 'TEST_EQUALS' in os.environ:
-        del os.environ['TEST_EQUALS']
+    monkeypatch.delenv('TEST_EQUALS', raising=False)
     
     result = load_env_file(str(env_file))
     
     assert result is True
     assert os.environ.get('TEST_EQUALS') == 'value=with=equals'
-    
-    # Cleanup
-    if 'TEST_EQUALS' in os.environ:
-        del os.environ['TEST_EQUALS']
 
 
 def test_load_env_file_auto_discover(tmp_path, monkeypatch):
     """Test auto-discovery of .env file in current directory."""
     # Change to tmp directory
     monkeypatch.chdir(tmp_path)
+    reset_env_cache()
     
     # Create .env file
     env_file = tmp_path / '.env'
     env_file.write_text('TEST_AUTO=auto_discovered')
     
-    if 'TEST_AUTO' in os.environ:
-        del os.environ['TEST_AUTO']
+    monkeypatch.delenv('TEST_AUTO', raising=False)
     
     # Load without specifying path
     result = load_env_file()
     
     assert result is True
     assert os.environ.get('TEST_AUTO') == 'auto_discovered'
+
+
+def test_load_env_file_empty(tmp_path):
+    """Test loading an empty .env file."""
+    env_file = tmp_path / '.env'
+    env_file.write_text('')
+    
+    result = load_env_file(str(env_file))
+    
+    assert result is True
+
+
+def test_load_env_file_reparses_on_change(tmp_path, monkeypatch):
+    """Test that a modified .env file is re-parsed rather than served from cache."""
+    env_file = tmp_path / '.env'
+    env_file.write_text('TEST_CACHED=first')
+    
+    monkeypatch.delenv('TEST_CACHED', raising=False)
+    
+    assert load_env_file(str(env_file)) is True
+    assert os.environ.get('TEST_CACHED') == 'first'
+    
+    monkeypatch.delenv('TEST_CACHED')
+    env_file.write_text('TEST_CACHED=second_value')
+    
+    assert load_env_file(str(env_file)) is True
+    assert os.environ.get('TEST_CACHED') == 'second_value'
+
+
+def test_load_env_file_discovery_cached(tmp_path, monkeypatch):
+    """Test that a missing .env is remembered until the cache is reset."""
+    work_dir = tmp_path / 'a' / 'b' / 'c'
+    work_dir.mkdir(parents=True)
+    monkeypatch.chdir(work_dir)
+    reset_env_cache()
+    
+    assert load_env_file() is False
+    
+    # Created after discovery ran: not picked up until the cache is reset
+    (work_dir / '.env').write_text('TEST_DISCOVERED=yes')
+    assert load_env_file() is False
+    
+    monkeypatch.delenv('TEST_DISCOVERED', raising=False)
     
-    # Cleanup
-    if 'TEST_AUTO' in os.environ:
-        del os.environ['TEST_AUTO']
+    reset_env_cache()
+    assert load_env_file() is True
+    assert os.environ.get('TEST_DISCOVERED') == 'yes'
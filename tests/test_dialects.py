@@ -1,55 +1,75 @@
 """Tests for SQL dialect helpers."""
 
+import pytest
 from src.dw_mcp.dialects import SQLDialectHelper
 from src.dw_mcp.connections import Platform
 
+KNOWN_PLATFORMS = [
+    Platform.MAXCOMPUTE,
+    Platform.HOLOGRES,
+    Platform.MYSQL,
+    Platform.POLARDB,
+    Platform.REDSHIFT,
+]
+
 
 class TestSQLDialectHelper:
     """Test SQL dialect helper functions."""
 
-    def test_get_platform_info(self):
+    @pytest.mark.parametrize("platform", KNOWN_PLATFORMS)
+    def test_get_platform_info(self, platform):
         """Test getting platform information."""
-        # Test known platforms
-        for platform in [
-            Platform.MAXCOMPUTE,
-            Platform.HOLOGRES,
-            Platform.MYSQL,
-            Platform.POLARDB,
-            Platform.REDSHIFT,
-        ]:
-            info = SQLDialectHelper.get_platform_info(platform)
-
-            assert "name" in info
-            assert "type" in info
-            assert "description" in info
-            assert "dialect" in info
-            assert "use_cases" in info
-            assert "features" in info
-            assert "common_functions" in info
-            assert len(info["features"]) > 0
-
-        # Test unknown platform
+        info = SQLDialectHelper.get_platform_info(platform)
+
+        assert "name" in info
+        assert "type" in info
+        assert "description" in info
+        assert "dialect" in info
+        assert "use_cases" in info
+        assert "features" in info
+        assert "common_functions" in info
+        assert len(info["features"]) > 0
+
+        # Static data: every call returns the same prebuilt dict
+        assert SQLDialectHelper.get_platform_info(platform) is info
+        assert SQLDialectHelper.get_example_queries(platform) is (
+            SQLDialectHelper.get_example_queries(platform)
+        )
+
+    def test_get_platform_info_unknown(self):
+        """Test getting information for an unknown platform."""
         info = SQLDialectHelper.get_platform_info("unknown")
         assert info["type"] == "Unknown"
 
-    def test_get_example_queries(self):
+    def test_get_platform_summary(self):
+        """Test the short platform description used by list_platforms."""
+        summary = SQLDialectHelper.get_platform_summary("mysql")
+        info = SQLDialectHelper.get_platform_info("mysql")
+        assert summary == {
+            "platform": "mysql",
+            "name": info["name"],
+            "type": info["type"],
+            "description": info["description"],
+        }
+
+        # Instance keys and unknown platforms fall back to the unknown info
+        summary = SQLDialectHelper.get_platform_summary("mysql_prod")
+        assert summary["platform"] == "mysql_prod"
+        assert summary["name"] == "mysql_prod"
+        assert summary["type"] == "Unknown"
+
+    @pytest.mark.parametrize("platform", KNOWN_PLATFORMS)
+    def test_get_example_queries(self, platform):
         """Test getting example queries."""
-        for platform in [
-            Platform.MAXCOMPUTE,
-            Platform.HOLOGRES,
-            Platform.MYSQL,
-            Platform.POLARDB,
-            Platform.REDSHIFT,
-        ]:
-            examples = SQLDialectHelper.get_example_queries(platform)
-
-            assert isinstance(examples, list)
-            assert len(examples) > 0
-
-            for example in examples:
-                assert "description" in example
-                assert "query" in example
-                assert isinstance(example["query"], str)
+        examples = SQLDialectHelper.get_example_queries(platform)
+
+        assert isinstance(examples, list)
+        assert len(examples) > 0
+
+        for example in examples:
+            assert "description" in example
+            assert "query" in example
+            assert isinstance(example["query"], str)
 
     def test_format_query_results(self):
         """Test formatting query results."""
@@ -58,8 +78,8 @@ class TestSQLDialectHelper:
             "success": True,
             "columns": ["id", "name", "age"],
             "rows": [
-                {"id": 1, "name": "Alice", "age": 30},
-                {"id": 2, "name": "Bob", "age": 25},
+                (1, "Alice", 30),
+                (2, "Bob", 25),
             ],
         }
 
@@ -81,8 +101,38 @@ class TestSQLDialectHelper:
         results = {
             "success": True,
             "columns": ["id"],
-            "rows": [{"id": 1}],
+            "rows": [(1,)],
         }
 
         formatted = SQLDialectHelper.format_query_results(results, "json")
         assert '"success": true' in formatted.lower()
+
+    def test_format_query_results_layout(self):
+        """Test the exact table layout, including padding and the row count."""
+        results = {
+            "success": True,
+            "columns": ["id", "name"],
+            "rows": [(1, "Alice"), (22, None)],
+        }
+
+        formatted = SQLDialectHelper.format_query_results(results, "table")
+        assert formatted == (
+            "id | name \n"
+            "---+------\n"
+            "1  | Alice\n"
+            "22 | None \n"
+            "\n"
+            "(2 rows)"
+        )
+
+        # Single row
+        results = {"success": True, "columns": ["count"], "rows": [(123456,)]}
+
+        formatted = SQLDialectHelper.format_query_results(results, "table")
+        assert formatted == "count \n------\n123456\n\n(1 rows)"
+
+        # Cell text is never interpreted as a format string
+        results = {"success": True, "columns": ["a", "b"], "rows": [("{0}", "{}"), ("x", "{b:>9}")]}
+
+        formatted = SQLDialectHelper.format_query_results(results, "table")
+        assert formatted == "a   | b     \n----+-------\n{0} | {}    \nx   | {b:>9}\n\n(2 rows)"
@@ -1,5 +1,6 @@
 """Tests for SQL safety checker."""
 
+from src.dw_mcp import safety
 from src.dw_mcp.safety import SQLSafetyChecker
 
 
@@ -20,6 +21,12 @@ class TestSQLSafetyChecker:
         assert not SQLSafetyChecker.is_select_query("UPDATE table SET col=1")
         assert not SQLSafetyChecker.is_select_query("DELETE FROM table")
 
+        # Only whole first words count
+        assert SQLSafetyChecker.is_select_query("desc table_name")
+        assert SQLSafetyChecker.is_select_query("\n\tSelect 1")
+        assert not SQLSafetyChecker.is_select_query("selection_table")
+        assert not SQLSafetyChecker.is_select_query("")
+
     def test_is_destructive(self):
         """Test destructive operation detection."""
         # Destructive operations
@@ -54,6 +61,57 @@ class TestSQLSafetyChecker:
             assert not is_dest, f"Query should be safe: {query}"
             assert len(patterns) == 0
 
+        # Matches are reported upper-cased and once per distinct statement
+        is_dest, patterns = SQLSafetyChecker.is_destructive(
+            "drop table a; DROP TABLE b; delete from c"
+        )
+        assert is_dest
+        assert patterns == ["DROP TABLE", "DELETE FROM"]
+
+    def test_is_destructive_read_only_prefix(self):
+        """Test that read-only first words only skip the scan for single statements."""
+        assert not SQLSafetyChecker.is_destructive("SELECT 'DROP TABLE x' AS note;")[0]
+
+        # Chained statements, CTEs and EXPLAIN are still scanned
+        assert SQLSafetyChecker.is_destructive("SELECT 1; DROP TABLE users")[0]
+        assert SQLSafetyChecker.is_destructive("WITH d AS (DELETE FROM t) SELECT 1")[0]
+        assert SQLSafetyChecker.is_destructive("EXPLAIN ANALYZE DELETE FROM users")[0]
+
+    def test_is_destructive_without_hyperscan(self, monkeypatch):
+        """Test that the regex fallback reports the same matches as the default path."""
+        query = "select 1; drop table a; UPDATE  users SET x=1; merge into t"
+        expected = SQLSafetyChecker.is_destructive(query)
+
+        monkeypatch.setattr(safety, "_HS_DB", None)
+        safety._cached_destructive_matches.cache_clear()
+        assert SQLSafetyChecker.is_destructive(query) == expected
+        assert expected[1] == ["DROP TABLE", "UPDATE  USERS SET", "MERGE INTO"]
+
+        # Non-ASCII identifiers still match
+        assert SQLSafetyChecker.is_destructive("UPDATE 用户 SET x=1")[0]
+
+    def test_is_destructive_cached_result_not_shared(self):
+        """Test that repeated queries get their own copy of the cached matches."""
+        query = "DELETE FROM users WHERE id = 1"
+        _, matches = SQLSafetyChecker.is_destructive(query)
+        matches.append("MODIFIED")
+
+        assert SQLSafetyChecker.is_destructive(query) == (True, ["DELETE FROM"])
+
+    def test_long_queries_not_cached(self):
+        """Test that queries above the length threshold bypass the scan caches."""
+        safety._cached_destructive_matches.cache_clear()
+        safety._cached_analyze.cache_clear()
+        query = "DELETE FROM users WHERE name = '" + "x" * safety._MAX_CACHED_QUERY_LEN + "'"
+
+        assert SQLSafetyChecker.is_destructive(query) == (True, ["DELETE FROM"])
+        assert SQLSafetyChecker.validate_query(query)[0] is False
+        assert safety._cached_destructive_matches.cache_info().currsize == 0
+        assert safety._cached_analyze.cache_info().currsize == 0
+
+        SQLSafetyChecker.validate_query("SELECT 1")
+        assert safety._cached_analyze.cache_info().currsize == 1
+
     def test_suggest_limit(self):
         """Test automatic LIMIT addition."""
         # Should add LIMIT
@@ -71,6 +129,28 @@ class TestSQLSafetyChecker:
         result = SQLSafetyChecker.suggest_limit(query, 100)
         assert "LIMIT" not in result
 
+        # Column names containing "limit" are not a LIMIT clause
+        query = "SELECT rate_limit FROM quotas;"
+        result = SQLSafetyChecker.suggest_limit(query, 100)
+        assert result == "SELECT rate_limit FROM quotas LIMIT 100"
+
+    def test_existing_limit_placeholders(self):
+        """Test that bind-parameter and ALL limits count as an existing LIMIT."""
+        queries = [
+            "SELECT * FROM users LIMIT ?",
+            "SELECT * FROM users LIMIT :n",
+            "SELECT * FROM users LIMIT %s",
+            "SELECT * FROM users LIMIT ALL",
+            "SELECT * FROM users limit\n10",
+        ]
+
+        for query in queries:
+            assert SQLSafetyChecker.has_limit(query)
+            assert SQLSafetyChecker.suggest_limit(query, 100) == query
+            assert SQLSafetyChecker.validate_query(query)[1] == query
+
+        assert not SQLSafetyChecker.has_limit("SELECT rate_limit, limited FROM quotas")
+
     def test_validate_query(self):
         """Test query validation."""
         # Valid SELECT query
@@ -98,3 +178,47 @@ class TestSQLSafetyChecker:
         is_valid, processed, msg = SQLSafetyChecker.validate_query("")
         assert not is_valid
         assert "empty" in msg.lower()
+
+    def test_validate_query_matches_suggest_limit(self):
+        """Test that validate_query applies LIMIT exactly like suggest_limit."""
+        queries = [
+            "SELECT * FROM users",
+            "  select * from users;  ",
+            "SELECT * FROM users LIMIT 50",
+            "SELECT rate_limit FROM quotas",
+            "SHOW TABLES",
+        ]
+
+        for query in queries:
+            is_valid, processed, _ = SQLSafetyChecker.validate_query(query, default_limit=10)
+            assert is_valid
+            assert processed == SQLSafetyChecker.suggest_limit(query, 10)
+
+    def test_validate_query_details(self):
+        """Test that validate_query_details reports the query classification."""
+        result = SQLSafetyChecker.validate_query_details("SELECT * FROM users")
+        assert result.is_valid
+        assert result.is_select
+        assert not result.is_destructive
+        assert tuple(result[:3]) == SQLSafetyChecker.validate_query("SELECT * FROM users")
+
+        result = SQLSafetyChecker.validate_query_details("DELETE FROM users")
+        assert not result.is_valid
+        assert not result.is_select
+        assert result.is_destructive
+
+        # Destructive statements inside a CTE are still flagged
+        result = SQLSafetyChecker.validate_query_details(
+            "WITH x AS (SELECT 1) DELETE FROM users", allow_destructive=True
+        )
+        assert result.is_valid
+        assert result.is_select
+        assert result.is_destructive
+
+    def test_module_functions(self):
+        """Test that the class methods are the module-level functions."""
+        assert SQLSafetyChecker.is_destructive is safety.is_destructive
+        assert SQLSafetyChecker.is_select_query is safety.is_select_query
+        assert SQLSafetyChecker.suggest_limit is safety.suggest_limit
+        assert SQLSafetyChecker.validate_query is safety.validate_query
+        assert SQLSafetyChecker.validate_query_details is safety.validate_query_details
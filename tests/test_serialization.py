@@ -0,0 +1,67 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from src.dw_mcp import serialization
+from src.dw_mcp.serialization import to_jsonable, dumps
+
+
+def test_to_jsonable_native_values_unchanged():
+    """Test that JSON-native values pass through as-is."""
+    for value in ["text", 1, 1.5, True, None]:
+        assert to_jsonable(value) is value
+
+
+def test_to_jsonable_converts_database_types():
+    """Test conversion of common non-JSON database types."""
+    assert to_jsonable(Decimal("1.50")) == "1.50"
+    assert to_jsonable(date(2024, 1, 1)) == "2024-01-01"
+    assert to_jsonable(datetime(2024, 1, 1, 12, 30)) == "2024-01-01T12:30:00"
+    assert to_jsonable(b"\x00\x01") == "AAE="
+
+
+def test_dumps_round_trip():
+    """Test that dumps produces JSON that loads back to the same structure."""
+    data = {"success": True, "columns": ["id"], "rows": [(1,), (2,)]}
+    
+    assert json.loads(dumps(data)) == {"success": True, "columns": ["id"], "rows": [[1], [2]]}
+
+
+def test_to_jsonable_converts_nested_values():
+    """Test that ARRAY and JSON/HSTORE values stay structured, converted recursively."""
+    assert to_jsonable([1, Decimal("2.5"), None]) == [1, "2.5", None]
+    assert to_jsonable(("a", date(2024, 1, 1))) == ["a", "2024-01-01"]
+    assert to_jsonable({"a": 1, "b": [Decimal("1.0")], "c": {"d": b"\x00"}}) == {
+        "a": 1,
+        "b": ["1.0"],
+        "c": {"d": "AA=="},
+    }
+    assert to_jsonable({1: "x"}) == {"1": "x"}
+
+
+def test_to_jsonable_non_finite_floats():
+    """Test that NaN and ±Infinity become None, which both encoders write as null."""
+    assert to_jsonable(1.5) == 1.5
+    assert to_jsonable(float("nan")) is None
+    assert to_jsonable([float("inf"), float("-inf")]) == [None, None]
+
+
+def test_dumps_same_output_without_orjson(monkeypatch):
+    """Test that the stdlib fallback produces the same JSON data as orjson."""
+    data = {
+        "name": "用户 café",
+        "created": datetime(2024, 1, 1, 12, 30, 0, 500),
+        "amount": Decimal("1.50"),
+        "tags": ["a", "b"],
+        "payload": {"k": None},
+        "rows": [tuple(map(to_jsonable, (1.5, float("nan"), float("inf"))))],
+    }
+    with_default = dumps(data)
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    without_orjson = dumps(data)
+    assert json.loads(without_orjson) == json.loads(with_default)
+    assert json.loads(without_orjson)["rows"] == [[1.5, None, None]]
+    assert "NaN" not in without_orjson and "Infinity" not in without_orjson
+    assert "用户 café" in with_default
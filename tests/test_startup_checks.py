@@ -8,10 +8,22 @@ from src.dw_mcp.startup_checks import (
     check_python_version,
     check_dependencies,
     auto_fix_config,
+    auto_fix_config_details,
     find_python310,
+    print_startup_banner,
+    run_startup_checks,
+    _REQUIRED_DEPS,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_find_python310():
+    """Clear find_python310's process-wide cache around each test."""
+    find_python310.cache_clear()
+    yield
+    find_python310.cache_clear()
+
+
 def test_check_python_version_pass(capsys):
     """Test that check_python_version passes for Python 3.10+."""
     # This test assumes we're running on Python 3.10+
@@ -23,15 +35,17 @@ def test_check_python_version_pass(capsys):
         assert "✓ Python version:" in captured.out
 
 
-def test_check_python_version_fail():
+def test_check_python_version_fail(capsys):
     """Test that check_python_version fails for Python < 3.10."""
-    # Create a named tuple to properly mock sys.version_info
-    from collections import namedtuple
-    VersionInfo = namedtuple('VersionInfo', ['major', 'minor', 'micro', 'releaselevel', 'serial'])
-    
-    with patch('sys.version_info', VersionInfo(3, 9, 0, 'final', 0)):
+    # The version is checked once at import, so patch the precomputed values
+    with patch('src.dw_mcp.startup_checks._PY310_OK', False), \
+            patch('src.dw_mcp.startup_checks._PY_VERSION_STR', '3.9.0'):
         result = check_python_version()
         assert result is False
+        
+        captured = capsys.readouterr()
+        assert "❌ Python version too low" in captured.out
+        assert "Current: 3.9.0" in captured.out
 
 
 def test_auto_fix_dataworks_endpoint():
@@ -43,12 +57,13 @@ def test_auto_fix_dataworks_endpoint():
     }
     
     with patch.dict(os.environ, test_env, clear=False):
-        fixes = auto_fix_config()
+        result = auto_fix_config_details()
         
         # Should have generated ENDPOINT
         assert 'DATAWORKS_HK_BDW_ENDPOINT' in os.environ
         assert 'cn-hongkong' in os.environ['DATAWORKS_HK_BDW_ENDPOINT']
-        assert any('Generated DATAWORKS_HK_BDW_ENDPOINT' in fix for fix in fixes)
+        assert 'DATAWORKS_HK_BDW_ENDPOINT' in result.fixed_keys
+        assert 'Generated DATAWORKS_HK_BDW_ENDPOINT' in result.messages
         
         # Cleanup
         if 'DATAWORKS_HK_BDW_ENDPOINT' in os.environ:
@@ -62,12 +77,13 @@ def test_auto_fix_hologres_type():
     }
     
     with patch.dict(os.environ, test_env, clear=False):
-        fixes = auto_fix_config()
+        result = auto_fix_config_details()
         
         # Should have added TYPE
         assert 'HOLO_HK_CHATBI_TYPE' in os.environ
         assert os.environ['HOLO_HK_CHATBI_TYPE'] == 'HOLOGRES'
-        assert any('Added HOLO_HK_CHATBI_TYPE' in fix for fix in fixes)
+        assert 'HOLO_HK_CHATBI_TYPE' in result.fixed_keys
+        assert 'Added HOLO_HK_CHATBI_TYPE=HOLOGRES' in result.messages
         
         # Cleanup
         if 'HOLO_HK_CHATBI_TYPE' in os.environ:
@@ -81,11 +97,12 @@ def test_auto_fix_redshift_type_case():
     }
     
     with patch.dict(os.environ, test_env, clear=False):
-        fixes = auto_fix_config()
+        result = auto_fix_config_details()
         
         # Should have fixed case
         assert os.environ['REDSHIFT_EU_AVBU_TYPE'] == 'REDSHIFT'
-        assert any('Fixed REDSHIFT_EU_AVBU_TYPE' in fix for fix in fixes)
+        assert 'REDSHIFT_EU_AVBU_TYPE' in result.fixed_keys
+        assert 'Fixed REDSHIFT_EU_AVBU_TYPE (lowercase → REDSHIFT)' in result.messages
 
 
 def test_auto_fix_mysql_type_case():
@@ -95,11 +112,11 @@ def test_auto_fix_mysql_type_case():
     }
     
     with patch.dict(os.environ, test_env, clear=False):
-        fixes = auto_fix_config()
+        result = auto_fix_config_details()
         
         # Should have fixed case
         assert os.environ['MYSQL_CN_TEST_TYPE'] == 'MYSQL'
-        assert any('Fixed MYSQL_CN_TEST_TYPE' in fix for fix in fixes)
+        assert 'MYSQL_CN_TEST_TYPE' in result.fixed_keys
 
 
 def test_auto_fix_polardb_type_case():
@@ -109,21 +126,33 @@ def test_auto_fix_polardb_type_case():
     }
     
     with patch.dict(os.environ, test_env, clear=False):
-        fixes = auto_fix_config()
+        result = auto_fix_config_details()
         
         # Should have fixed case
         assert os.environ['POLARDB_CN_TEST_TYPE'] == 'POLARDB'
-        assert any('Fixed POLARDB_CN_TEST_TYPE' in fix for fix in fixes)
+        assert 'POLARDB_CN_TEST_TYPE' in result.fixed_keys
 
 
 def test_auto_fix_no_issues():
     """Test auto_fix_config when there are no issues."""
     # Clear any test env vars
-    fixes = auto_fix_config()
+    result = auto_fix_config_details()
     
     # May or may not have fixes depending on actual environment
     # Just ensure it doesn't crash
-    assert isinstance(fixes, list)
+    assert isinstance(result.messages, list)
+    assert len(result.fixed_keys) == len(result.messages)
+
+
+def test_auto_fix_config_returns_messages():
+    """Test that auto_fix_config still returns a plain list of fix messages."""
+    with patch.dict(os.environ, {'MYSQL_CN_TEST_TYPE': 'mysql'}, clear=True):
+        fixes = auto_fix_config()
+        
+        assert fixes == ['Fixed MYSQL_CN_TEST_TYPE (lowercase → MYSQL)']
+    
+    with patch.dict(os.environ, {}, clear=True):
+        assert auto_fix_config() == []
 
 
 def test_find_python310():
@@ -135,13 +164,63 @@ def test_find_python310():
     assert isinstance(python_cmd, str)
 
 
-@patch('builtins.__import__')
-def test_check_dependencies_all_installed(mock_import, capsys):
+def test_find_python310_uses_versioned_commands():
+    """Test that the newest versioned command on PATH is used without spawning it."""
+    from collections import namedtuple
+    VersionInfo = namedtuple('VersionInfo', ['major', 'minor', 'micro', 'releaselevel', 'serial'])
+    
+    with patch('sys.version_info', VersionInfo(3, 9, 0, 'final', 0)), \
+            patch('shutil.which', side_effect=lambda cmd: cmd != 'python3.12') as mock_which, \
+            patch('subprocess.run') as mock_run:
+        assert find_python310() == 'python3.11'
+        assert find_python310() == 'python3.11'
+        
+        # Cached after the first lookup, and no child interpreter is run
+        assert mock_which.call_count == 2
+        mock_run.assert_not_called()
+    
+    find_python310.cache_clear()
+    with patch('sys.version_info', VersionInfo(3, 9, 0, 'final', 0)), \
+            patch('shutil.which', return_value=None):
+        assert find_python310() is None
+
+
+def test_find_python310_resolves_unversioned_symlinks(tmp_path):
+    """Test that python3 is used when it links to a 3.10+ binary."""
+    from collections import namedtuple
+    VersionInfo = namedtuple('VersionInfo', ['major', 'minor', 'micro', 'releaselevel', 'serial'])
+    
+    target = tmp_path / 'python3.11'
+    target.write_text('')
+    link = tmp_path / 'python3'
+    link.symlink_to(target)
+    paths = {'python3': str(link)}
+    
+    with patch('sys.version_info', VersionInfo(3, 9, 0, 'final', 0)), \
+            patch('shutil.which', side_effect=paths.get):
+        assert find_python310() == 'python3'
+    
+    # A link to an older interpreter is not used
+    target.rename(tmp_path / 'python3.9')
+    link.unlink()
+    link.symlink_to(tmp_path / 'python3.9')
+    find_python310.cache_clear()
+    with patch('sys.version_info', VersionInfo(3, 9, 0, 'final', 0)), \
+            patch('shutil.which', side_effect=paths.get):
+        assert find_python310() is None
+
+
+@patch('src.dw_mcp.startup_checks.find_spec')
+def test_check_dependencies_all_installed(mock_find_spec, capsys):
     """Test check_dependencies when all deps are installed."""
-    # Mock successful imports
-    mock_import.return_value = MagicMock()
+    # Mock every package being found
+    mock_find_spec.return_value = MagicMock()
     
-    result = check_dependencies()
+    with patch.dict(sys.modules, clear=False):
+        for module, _ in _REQUIRED_DEPS:
+            sys.modules.pop(module, None)
+        
+        result = check_dependencies()
     
     # Should pass
     assert result is True
@@ -150,18 +229,21 @@ def test_check_dependencies_all_installed(mock_import, capsys):
     assert "✓ All dependencies installed" in captured.out
 
 
-@patch('builtins.__import__')
-def test_check_dependencies_missing(mock_import, capsys):
+@patch('src.dw_mcp.startup_checks.find_spec')
+def test_check_dependencies_missing(mock_find_spec, capsys):
     """Test check_dependencies when some deps are missing."""
-    # Mock ImportError for specific module
-    def import_side_effect(name, *args, **kwargs):
+    # Mock a missing package for a specific module
+    def find_spec_side_effect(name, *args, **kwargs):
         if name == 'odps':
-            raise ImportError(f"No module named '{name}'")
+            return None
         return MagicMock()
     
-    mock_import.side_effect = import_side_effect
+    mock_find_spec.side_effect = find_spec_side_effect
     
-    result = check_dependencies()
+    with patch.dict(sys.modules, clear=False):
+        sys.modules.pop('odps', None)
+        
+        result = check_dependencies()
     
     # Should fail
     assert result is False
@@ -169,3 +251,59 @@ def test_check_dependencies_missing(mock_import, capsys):
     captured = capsys.readouterr()
     assert "❌ Missing dependencies:" in captured.out
     assert "pyodps" in captured.out
+    
+    # Packages are only located, never imported
+    mock_find_spec.assert_any_call('odps')
+
+
+def test_auto_fix_ignores_unrelated_keys():
+    """Test that auto_fix_config leaves keys outside the instance patterns alone."""
+    test_env = {
+        'DATAWORKS_HK_REGION': 'cn-hongkong',  # no instance name
+        'MYSQL_CN_TEST_TYPE': 'MYSQL',  # already upper case
+        'OTHER_CN_TEST_TYPE': 'mysql',
+    }
+    
+    with patch.dict(os.environ, test_env, clear=True):
+        result = auto_fix_config_details()
+        
+        assert result.messages == []
+        assert result.fixed_keys == set()
+        assert dict(os.environ) == test_env
+
+
+def test_print_startup_banner_groups_without_connecting(capsys):
+    """Test that the banner groups instances by type and doesn't create engines."""
+    conn_manager = MagicMock()
+    conn_manager.list_available_platforms.return_value = [
+        'mysql_cn_test', 'hologres', 'mysql', 'holo_hk_chatbi',
+    ]
+    conn_manager.list_unavailable_platforms.return_value = ['mysql_cn_broken']
+    conn_manager.is_engine_cached.side_effect = lambda p: p == 'mysql'
+    
+    print_startup_banner(conn_manager)
+    
+    conn_manager.get_engine.assert_not_called()
+    captured = capsys.readouterr()
+    assert "Configured Platform Instances (5)" in captured.out
+    assert (
+        "  HOLO:\n    ○ holo_hk_chatbi (connects on first use)\n\n"
+        "  HOLOGRES:\n    ○ hologres (connects on first use)\n\n"
+        "  MYSQL:\n    ✓ mysql\n"
+        "    ✗ mysql_cn_broken (incomplete configuration or engine error)\n"
+        "    ○ mysql_cn_test (connects on first use)\n"
+    ) in captured.out
+    assert "DW_MCP_SKIP_CHECKS=1" in captured.out
+
+
+def test_run_startup_checks_skipped(capsys):
+    """Test that DW_MCP_SKIP_CHECKS=1 bypasses all startup checks."""
+    conn_manager = MagicMock()
+    
+    with patch.dict(os.environ, {'DW_MCP_SKIP_CHECKS': '1'}), \
+            patch('src.dw_mcp.startup_checks.check_dependencies') as mock_check:
+        assert run_startup_checks(conn_manager) is True
+        
+        mock_check.assert_not_called()
+        conn_manager.list_available_platforms.assert_not_called()
+        assert capsys.readouterr().out == ""